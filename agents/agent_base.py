@@ -5,26 +5,195 @@ Provides the foundational HemoStatAgent base class that all specialized agents i
 Encapsulates Redis pub/sub communication patterns and shared state management.
 """
 
-import json
+import asyncio
+import functools
+import logging
 import os
 import signal
-import time
+import socket
+import threading
+import weakref
 from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
+import orjson
 import redis
+import redis.asyncio as aioredis
 from dotenv import load_dotenv
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from agents.logger import HemoStatLogger
 from agents.platform_utils import get_platform_display
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional at runtime, declared as a core dependency
+    zstandard = None
+
 # Load environment variables from .env file
 load_dotenv()
 
 # Get logger for this module
 logger = HemoStatLogger.get_logger("agent_base")
 
+# TCP keepalive tuning so dead Redis peers are detected in ~90s instead of the OS default
+# (~2h). The constants are not defined on every platform (e.g., TCP_KEEPIDLE on macOS).
+# redis-py already sets TCP_NODELAY on every connection it opens.
+_KEEPALIVE_OPTIONS: dict[int, int] = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
+# orjson (de)serializers for Redis payloads. Encoding yields compact UTF-8 bytes that
+# redis-py sends as-is, and decoding reads the raw bytes replies directly.
+# OPT_NON_STR_KEYS keeps parity with json.dumps, which coerces int/float keys to strings.
+_dumps = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+_loads = orjson.loads
+
+# Payloads larger than this many bytes are zstd-compressed before being written to Redis
+# (0 disables compression). Compressed values start with the zstd frame magic number,
+# which can never begin a JSON document, so readers can tell the two formats apart.
+_COMPRESS_THRESHOLD = int(os.getenv("REDIS_COMPRESS_THRESHOLD", 512))
+_COMPRESS_LEVEL = 3
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def encode_payload(value: Any) -> bytes:
+    """
+    Serialize a value to JSON bytes for Redis, compressing it when large.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        JSON bytes, or a zstd frame containing them if above REDIS_COMPRESS_THRESHOLD
+
+    Raises:
+        TypeError: If the value is not JSON-serializable
+    """
+    data = _dumps(value)
+    if zstandard is not None and 0 < _COMPRESS_THRESHOLD < len(data):
+        return zstandard.compress(data, _COMPRESS_LEVEL)
+    return data
+
+
+def decode_payload(data: bytes | str) -> Any:
+    """
+    Deserialize a value written by encode_payload(), decompressing it if needed.
+
+    Plain JSON written by other tools is accepted unchanged.
+
+    Args:
+        data: Raw value read from Redis
+
+    Returns:
+        Deserialized value
+
+    Raises:
+        ValueError: If the data is not valid JSON or cannot be decompressed
+    """
+    if isinstance(data, bytes) and data[:4] == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise ValueError("Compressed payload received but zstandard is not installed")
+        try:
+            data = zstandard.decompress(data)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Failed to decompress payload: {e!s}") from e
+    return _loads(data)
+
+
+# Retry and pool settings are fixed for the life of the process, so resolve them once
+_RETRY_MAX = int(os.getenv("AGENT_RETRY_MAX", 3))
+_RETRY_DELAY = float(os.getenv("AGENT_RETRY_DELAY", 1))
+_POOL_MAX = int(os.getenv("REDIS_POOL_MAX", 32))
+_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", 5))
+
+# Seconds the listener waits for a message before re-checking whether it should stop
+_LISTEN_POLL_TIMEOUT = 1.0
+
+# Upper bound for retry backoff
+_RETRY_MAX_DELAY = 30.0
+
+
+def _redis_retry(
+    action: str, exceptions: type[Exception] | tuple[type[Exception], ...]
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Build the retry decorator used by agent methods that talk to Redis.
+
+    Attempts are capped at AGENT_RETRY_MAX with exponential backoff starting at
+    AGENT_RETRY_DELAY. Jitter spreads out retries from agents that fail at the same moment
+    (e.g., when Redis restarts) so they don't reconnect in lock-step. Works on both plain
+    and async methods; the last exception is re-raised once attempts are exhausted.
+
+    Args:
+        action: Description of the operation used in retry warnings
+        exceptions: Exception types that trigger a retry
+
+    Returns:
+        Decorator for HemoStatAgent methods
+    """
+
+    def log_retry(retry_state: RetryCallState) -> None:
+        agent = retry_state.args[0]
+        agent.logger.warning(
+            f"{action} failed (attempt {retry_state.attempt_number}/{_RETRY_MAX}). "
+            f"Retrying in {retry_state.next_action.sleep:.2f}s... "
+            f"Error: {retry_state.outcome.exception()!s}"
+        )
+
+    return retry(
+        stop=stop_after_attempt(_RETRY_MAX),
+        wait=wait_exponential_jitter(initial=_RETRY_DELAY, max=_RETRY_MAX_DELAY),
+        retry=retry_if_exception_type(exceptions),
+        before_sleep=log_retry,
+        reraise=True,
+    )
+
+
+# Agents alive in this process; all of them are stopped when SIGTERM/SIGINT arrives.
+# Handlers are installed once so constructing a second agent doesn't replace the first's.
+_live_agents: "weakref.WeakSet[HemoStatAgent]" = weakref.WeakSet()
+_signal_lock = threading.Lock()
+_signal_handlers_installed = False
+
+
+def _stop_live_agents(signum: int, frame: Any) -> None:
+    """
+    Process-wide SIGTERM/SIGINT handler that shuts down every live agent.
+
+    Args:
+        signum: Signal number
+        frame: Current stack frame
+    """
+    for agent in list(_live_agents):
+        agent._handle_shutdown_signal(signum, frame)
+
+
+def _register_for_shutdown(agent: "HemoStatAgent") -> None:
+    """
+    Track an agent for graceful shutdown, installing the signal handlers on first use.
+
+    Args:
+        agent: Agent to stop when the process receives SIGTERM or SIGINT
+    """
+    global _signal_handlers_installed
+
+    with _signal_lock:
+        _live_agents.add(agent)
+        if not _signal_handlers_installed:
+            signal.signal(signal.SIGTERM, _stop_live_agents)
+            signal.signal(signal.SIGINT, _stop_live_agents)
+            _signal_handlers_installed = True
+
 
 class HemoStatConnectionError(Exception):
     """Custom exception for Redis connection failures."""
@@ -40,6 +209,25 @@ class HemoStatAgent:
     All specialized agents (Monitor, Analyzer, Responder, Alert) inherit from this class.
     """
 
+    # Fixed attribute layout for the base state; subclasses still get a __dict__ for their own
+    __slots__ = (
+        "__weakref__",
+        "_async_redis",
+        "_stop_event",
+        "_subscriptions",
+        "agent_name",
+        "logger",
+        "pubsub",
+        "redis",
+        "redis_db",
+        "redis_host",
+        "redis_port",
+        "running",
+    )
+
+    # Namespace prefix for keys managed by get_shared_state()/set_shared_state()
+    _STATE_PREFIX = "hemostat:state:"
+
     def __init__(
         self,
         agent_name: str,
@@ -60,8 +248,13 @@ class HemoStatAgent:
             HemoStatConnectionError: If Redis connection fails after retries
         """
         self.agent_name = agent_name
-        self._running = False
-        self._subscriptions: dict[str, Callable] = {}
+        # Plain attribute (not a property) since listener loops check it on every iteration
+        self.running = False
+        # Set by stop() to wake run loops that are sleeping between iterations
+        self._stop_event = threading.Event()
+        # Keyed by encoded channel name, matching the bytes Redis returns in messages
+        self._subscriptions: dict[bytes, Callable] = {}
+        self._async_redis: aioredis.Redis | None = None
 
         # Load Redis config from environment or use defaults
         if redis_host is None:
@@ -82,15 +275,42 @@ class HemoStatAgent:
         # Set up pub/sub
         self.pubsub = self.redis.pubsub()
 
-        # Register signal handlers for graceful shutdown
-        signal.signal(signal.SIGTERM, self._handle_shutdown_signal)
-        signal.signal(signal.SIGINT, self._handle_shutdown_signal)
+        # Register for graceful shutdown on SIGTERM/SIGINT
+        _register_for_shutdown(self)
 
         self.logger.info(
             f"Agent '{self.agent_name}' initialized successfully on {get_platform_display()}",
             extra={"agent": self.agent_name},
         )
 
+    def _redis_connection_kwargs(self) -> dict[str, Any]:
+        """
+        Build the connection settings shared by the sync and async Redis clients.
+
+        Returns:
+            Keyword arguments accepted by both redis.Redis and redis.asyncio.Redis pools
+        """
+        redis_kwargs: dict[str, Any] = {
+            "host": self.redis_host,
+            "port": self.redis_port,
+            "db": self.redis_db,
+            # Sent with CLIENT SETNAME on every new connection so CLIENT LIST shows which
+            # agent owns each socket
+            "client_name": self.agent_name,
+            # Responses stay as raw bytes: JSON payloads are parsed straight from bytes,
+            # skipping a UTF-8 decode of every value and message
+            "decode_responses": False,
+            "socket_connect_timeout": 5,
+            "socket_keepalive": True,
+            "socket_keepalive_options": _KEEPALIVE_OPTIONS,
+        }
+
+        redis_password = os.getenv("REDIS_PASSWORD", "").strip()
+        if redis_password:
+            redis_kwargs["password"] = redis_password
+
+        return redis_kwargs
+
     def _connect_redis(self) -> redis.Redis:
         """
         Connect to Redis with exponential backoff retry logic.
@@ -101,51 +321,38 @@ class HemoStatAgent:
         Raises:
             HemoStatConnectionError: If connection fails after configured attempts
         """
-        max_retries = int(os.getenv("AGENT_RETRY_MAX", 3))
-        initial_delay = float(os.getenv("AGENT_RETRY_DELAY", 1))
-
-        # Build exponential backoff list
-        retry_delays = [initial_delay * (2**i) for i in range(max_retries)]
-
-        redis_password = os.getenv("REDIS_PASSWORD", "").strip()
+        # Bounded pool shared by all commands issued by this agent; callers wait for
+        # a free connection instead of opening new sockets under load. The pub/sub
+        # object checks out its own dedicated connection from the same pool.
+        # Built once; only the PING is retried, so failed attempts don't leave pools behind.
+        pool = redis.BlockingConnectionPool(
+            max_connections=_POOL_MAX, timeout=_POOL_TIMEOUT, **self._redis_connection_kwargs()
+        )
+        client = redis.Redis(connection_pool=pool)
+        try:
+            self._ping_redis(client)
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            pool.disconnect()
+            error_msg = f"Failed to connect to Redis after {_RETRY_MAX} attempts. Last error: {e!s}"
+            self.logger.error(error_msg)
+            raise HemoStatConnectionError(error_msg) from e
+
+        self.logger.info(f"Connected to Redis at {self.redis_host}:{self.redis_port}")
+        return client
+
+    @_redis_retry("Redis connection", (redis.ConnectionError, redis.TimeoutError))
+    def _ping_redis(self, client: redis.Redis) -> None:
+        """
+        Verify a Redis client's connection with PING, retrying on failure.
 
-        for attempt in range(max_retries):
-            try:
-                redis_kwargs: dict[str, Any] = {
-                    "host": self.redis_host,
-                    "port": self.redis_port,
-                    "db": self.redis_db,
-                    "decode_responses": True,
-                    "socket_connect_timeout": 5,
-                    "socket_keepalive": True,
-                }
-                if redis_password:
-                    redis_kwargs["password"] = redis_password
-
-                client = redis.Redis(**redis_kwargs)  # type: ignore[arg-type]
-                # Test connection
-                client.ping()
-                self.logger.info(f"Connected to Redis at {self.redis_host}:{self.redis_port}")
-                return client
-            except (redis.ConnectionError, redis.TimeoutError) as e:
-                if attempt < max_retries - 1:
-                    wait_time = retry_delays[attempt]
-                    self.logger.warning(
-                        f"Redis connection failed (attempt {attempt + 1}/{max_retries}). "
-                        f"Retrying in {wait_time}s... Error: {e!s}"
-                    )
-                    time.sleep(wait_time)
-                else:
-                    error_msg = (
-                        f"Failed to connect to Redis after {max_retries} attempts. "
-                        f"Last error: {e!s}"
-                    )
-                    self.logger.error(error_msg)
-                    raise HemoStatConnectionError(error_msg) from e
+        Args:
+            client: Redis client to test
 
-        # This should never be reached, but satisfies type checker
-        msg = f"Failed to connect to Redis after {max_retries} attempts"
-        raise HemoStatConnectionError(msg)
+        Raises:
+            redis.ConnectionError: If the last attempt could not connect
+            redis.TimeoutError: If the last attempt timed out
+        """
+        client.ping()
 
     def publish_event(self, channel: str, event_type: str, data: dict[str, Any]) -> bool:
         """
@@ -159,47 +366,80 @@ class HemoStatAgent:
         Returns:
             True if publish succeeded, False otherwise
         """
-        max_retries = int(os.getenv("AGENT_RETRY_MAX", 3))
-        initial_delay = float(os.getenv("AGENT_RETRY_DELAY", 1))
+        return self.publish_events([(channel, event_type, data)])
 
-        # Build exponential backoff list
-        retry_delays = [initial_delay * (2**i) for i in range(max_retries)]
+    def publish_events(self, events: list[tuple[str, str, dict[str, Any]]]) -> bool:
+        """
+        Publish several structured events in a single pipelined round trip.
 
-        event_payload = {
-            "event_type": event_type,
-            "timestamp": datetime.now(UTC).isoformat(),
-            "agent": self.agent_name,
-            "data": data,
-        }
+        Events are published in order and share one timestamp. On a Redis error the whole
+        batch is retried, so subscribers may see an event more than once.
 
-        for attempt in range(max_retries):
-            try:
-                json_payload = json.dumps(event_payload)
-                num_subscribers = self.redis.publish(channel, json_payload)
-                self.logger.info(
-                    f"Published event '{event_type}' to channel '{channel}' "
-                    f"({num_subscribers} subscribers)"
+        Args:
+            events: (channel, event_type, data) tuples to publish
+
+        Returns:
+            True if every event was published, False otherwise
+        """
+        if not events:
+            return True
+
+        timestamp = datetime.now(UTC).isoformat()
+
+        try:
+            messages = [
+                (
+                    channel,
+                    encode_payload(
+                        {
+                            "event_type": event_type,
+                            "timestamp": timestamp,
+                            "agent": self.agent_name,
+                            "data": data,
+                        }
+                    ),
                 )
-                return True
-            except (TypeError, ValueError) as e:
-                self.logger.error(f"Failed to serialize event payload: {e!s}")
-                return False
-            except redis.RedisError as e:
-                if attempt < max_retries - 1:
-                    wait_time = retry_delays[attempt]
-                    self.logger.warning(
-                        f"Failed to publish event (attempt {attempt + 1}/{max_retries}). "
-                        f"Retrying in {wait_time}s... Error: {e!s}"
-                    )
-                    time.sleep(wait_time)
-                else:
-                    self.logger.error(
-                        f"Failed to publish event after {max_retries} attempts. Last error: {e!s}"
-                    )
-                    return False
+                for channel, event_type, data in events
+            ]
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Failed to serialize event payload: {e!s}")
+            return False
+
+        try:
+            subscriber_counts = self._execute_publish(messages)
+        except redis.RedisError as e:
+            self.logger.error(
+                f"Failed to publish event after {_RETRY_MAX} attempts. Last error: {e!s}"
+            )
+            return False
+
+        for (channel, event_type, _), num_subscribers in zip(
+            events, subscriber_counts, strict=True
+        ):
+            self.logger.info(
+                f"Published event '{event_type}' to channel '{channel}' "
+                f"({num_subscribers} subscribers)"
+            )
+        return True
+
+    @_redis_retry("Event publish", redis.RedisError)
+    def _execute_publish(self, messages: list[tuple[str, bytes]]) -> list[int]:
+        """
+        Send encoded events in one pipelined round trip, retrying on Redis errors.
 
-        # This should never be reached, but satisfies type checker
-        return False
+        Args:
+            messages: (channel, encoded payload) pairs to publish in order
+
+        Returns:
+            Subscriber count for each message
+
+        Raises:
+            redis.RedisError: If the last attempt failed
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        for channel, json_payload in messages:
+            pipe.publish(channel, json_payload)
+        return pipe.execute()
 
     def subscribe_to_channel(
         self, channel: str, callback: Callable[[dict[str, Any]], None]
@@ -214,7 +454,7 @@ class HemoStatAgent:
         """
         try:
             self.pubsub.subscribe(channel)
-            self._subscriptions[channel] = callback
+            self._subscriptions[channel.encode()] = callback
             self.logger.info(f"Subscribed to channel '{channel}'")
         except redis.RedisError as e:
             self.logger.error(f"Failed to subscribe to channel '{channel}': {e!s}")
@@ -223,36 +463,240 @@ class HemoStatAgent:
         """
         Start the pub/sub message listening loop.
 
-        Blocks until stop() is called. Handles messages and exceptions gracefully.
+        Blocks until stop() is called; shutdown is noticed within one poll interval.
+        Handles messages and exceptions gracefully.
         """
-        self._running = True
+        self.running = True
+        self._stop_event.clear()
         self.logger.info("Starting message listening loop")
 
+        # Bind everything the per-message path touches to locals once, outside the loop.
+        # Channels are matched on the raw bytes Redis returns.
+        get_message = self.pubsub.get_message
+        get_callback = self._subscriptions.get
+        decode = decode_payload
+        log_debug = self.logger.debug
+        log_error = self.logger.error
+        debug_enabled = self.logger.isEnabledFor
+
         try:
-            for message in self.pubsub.listen():
-                if not self._running:
-                    break
-
-                if message["type"] == "message":
-                    try:
-                        payload = json.loads(message["data"])
-                        self.logger.debug(
-                            f"Received message on channel '{message['channel']}': "
-                            f"{payload.get('event_type', 'unknown')}"
-                        )
-                        # Invoke registered callback if it exists
-                        callback = self._subscriptions.get(message["channel"])
-                        if callback:
-                            callback(payload)
-                    except json.JSONDecodeError as e:
-                        self.logger.error(f"Failed to deserialize message: {e!s}")
-                    except Exception as e:
-                        self.logger.error(f"Error processing message: {e!s}", exc_info=True)
+            # Poll with a timeout rather than blocking in listen(), so a stop() request is
+            # noticed within a second even when no messages are arriving
+            while self.running:
+                message = get_message(ignore_subscribe_messages=True, timeout=_LISTEN_POLL_TIMEOUT)
+                if message is None:
+                    continue
+
+                callback = get_callback(message["channel"])
+                if callback is None:
+                    continue
+
+                try:
+                    payload = decode(message["data"])
+                except ValueError as e:
+                    log_error(f"Failed to deserialize message: {e!s}")
+                    continue
+
+                # Skip decoding the channel and formatting the line unless DEBUG is on
+                if debug_enabled(logging.DEBUG):
+                    log_debug(
+                        f"Received message on channel '{message['channel'].decode()}': "
+                        f"{payload.get('event_type', 'unknown')}"
+                    )
+                try:
+                    callback(payload)
+                except Exception as e:
+                    log_error(f"Error processing message: {e!s}", exc_info=True)
         except Exception as e:
             self.logger.error(f"Listening loop error: {e!s}", exc_info=True)
         finally:
             self.logger.info("Message listening loop stopped")
 
+    def _dispatch_message(
+        self, callback: Callable[[dict[str, Any]], None], message: dict[str, Any]
+    ) -> None:
+        """
+        Deserialize a pub/sub message and invoke the callback registered for its channel.
+
+        Used by the async listener; start_listening() inlines the same steps.
+
+        Args:
+            callback: Handler registered for the message's channel
+            message: Raw pub/sub message with 'channel' and 'data' fields (as bytes)
+        """
+        try:
+            payload = decode_payload(message["data"])
+        except ValueError as e:
+            self.logger.error(f"Failed to deserialize message: {e!s}")
+            return
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Received message on channel '{message['channel'].decode()}': "
+                f"{payload.get('event_type', 'unknown')}"
+            )
+        try:
+            callback(payload)
+        except Exception as e:
+            self.logger.error(f"Error processing message: {e!s}", exc_info=True)
+
+    async def _connect_redis_async(self) -> aioredis.Redis:
+        """
+        Connect an asyncio Redis client with exponential backoff retry logic.
+
+        Mirrors _connect_redis(); retries wait with asyncio.sleep() so they do not block
+        other coroutines sharing the event loop.
+
+        Returns:
+            Connected asyncio Redis client instance
+
+        Raises:
+            HemoStatConnectionError: If connection fails after configured attempts
+        """
+        # Built once; only the PING is retried, so failed attempts don't leave pools behind
+        client = aioredis.Redis(**self._redis_connection_kwargs())
+        try:
+            await self._ping_redis_async(client)
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            await client.aclose()
+            error_msg = (
+                f"Failed to connect async Redis client after {_RETRY_MAX} attempts. "
+                f"Last error: {e!s}"
+            )
+            self.logger.error(error_msg)
+            raise HemoStatConnectionError(error_msg) from e
+
+        self.logger.info(f"Connected async Redis client at {self.redis_host}:{self.redis_port}")
+        return client
+
+    @_redis_retry("Async Redis connection", (redis.ConnectionError, redis.TimeoutError))
+    async def _ping_redis_async(self, client: aioredis.Redis) -> None:
+        """
+        Verify an asyncio Redis client's connection with PING, retrying on failure.
+
+        Args:
+            client: asyncio Redis client to test
+
+        Raises:
+            redis.ConnectionError: If the last attempt could not connect
+            redis.TimeoutError: If the last attempt timed out
+        """
+        await client.ping()
+
+    async def publish_event_async(
+        self, channel: str, event_type: str, data: dict[str, Any]
+    ) -> bool:
+        """
+        Publish a structured event from a coroutine without blocking the event loop.
+
+        Uses the asyncio client opened by start_listening_async(), connecting one on
+        first use if necessary.
+
+        Args:
+            channel: Redis channel name (e.g., 'hemostat:events:health')
+            event_type: Type of event (e.g., 'container_unhealthy')
+            data: Event payload data
+
+        Returns:
+            True if publish succeeded, False otherwise
+        """
+        event_payload = {
+            "event_type": event_type,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "agent": self.agent_name,
+            "data": data,
+        }
+
+        try:
+            json_payload = encode_payload(event_payload)
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Failed to serialize event payload: {e!s}")
+            return False
+
+        try:
+            num_subscribers = await self._execute_publish_async(channel, json_payload)
+        except (redis.RedisError, HemoStatConnectionError) as e:
+            self.logger.error(
+                f"Failed to publish event after {_RETRY_MAX} attempts. Last error: {e!s}"
+            )
+            return False
+
+        self.logger.info(
+            f"Published event '{event_type}' to channel '{channel}' "
+            f"({num_subscribers} subscribers)"
+        )
+        return True
+
+    @_redis_retry("Event publish", (redis.RedisError, HemoStatConnectionError))
+    async def _execute_publish_async(self, channel: str, json_payload: bytes) -> int:
+        """
+        Publish one encoded event on the asyncio client, retrying on Redis errors.
+
+        Args:
+            channel: Redis channel name
+            json_payload: Payload produced by encode_payload()
+
+        Returns:
+            Number of subscribers that received the message
+
+        Raises:
+            redis.RedisError: If the last attempt failed
+            HemoStatConnectionError: If the asyncio client could not be connected
+        """
+        if self._async_redis is None:
+            self._async_redis = await self._connect_redis_async()
+        return await self._async_redis.publish(channel, json_payload)
+
+    async def start_listening_async(self) -> None:
+        """
+        Run the pub/sub message listening loop as a coroutine.
+
+        Asyncio counterpart of start_listening() for processes that host several agents or
+        other I/O on one event loop. Subscribes to every channel registered through
+        subscribe_to_channel() and dispatches to the same callbacks. Returns when stop()
+        is called or the task is cancelled.
+        """
+        if self._async_redis is None:
+            self._async_redis = await self._connect_redis_async()
+
+        # Release the sync pub/sub connection so its subscriptions don't buffer unread
+        # copies of every message server-side while the async loop is consuming them
+        self.pubsub.close()
+
+        pubsub = self._async_redis.pubsub()
+        self.running = True
+        self._stop_event.clear()
+        self.logger.info("Starting async message listening loop")
+
+        get_callback = self._subscriptions.get
+
+        try:
+            await pubsub.subscribe(*self._subscriptions)
+
+            while self.running:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=_LISTEN_POLL_TIMEOUT
+                )
+                if message is None:
+                    continue
+
+                callback = get_callback(message["channel"])
+                if callback is not None:
+                    self._dispatch_message(callback, message)
+        except asyncio.CancelledError:
+            self.logger.info("Async listening loop cancelled")
+            raise
+        except Exception as e:
+            self.logger.error(f"Async listening loop error: {e!s}", exc_info=True)
+        finally:
+            try:
+                await pubsub.aclose()
+                await self._async_redis.aclose()
+            except Exception as e:
+                self.logger.error(f"Error closing async Redis connection: {e!s}")
+            self._async_redis = None
+            self.logger.info("Async message listening loop stopped")
+
     def get_shared_state(self, key: str) -> dict[str, Any] | None:
         """
         Retrieve shared state from Redis.
@@ -264,22 +708,26 @@ class HemoStatAgent:
             Deserialized state dict, or None if key doesn't exist or error occurs
         """
         try:
-            full_key = f"hemostat:state:{key}"
-            value = self.redis.get(full_key)
+            full_key = self._STATE_PREFIX + key
+
+            # Fetch value and TTL in a single round trip
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.get(full_key)
+            pipe.ttl(full_key)
+            value, ttl = pipe.execute()
 
             if value is None:
                 return None
 
-            # Check TTL and warn if expiring soon
-            ttl = self.redis.ttl(full_key)
+            # Warn if expiring soon
             if ttl > 0 and ttl < 300:  # Less than 5 minutes
                 self.logger.warning(f"Shared state '{key}' expiring soon (TTL: {ttl}s)")
 
-            return json.loads(value)
+            return decode_payload(value)
         except redis.RedisError as e:
             self.logger.error(f"Failed to get shared state '{key}': {e!s}")
             return None
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             self.logger.error(f"Failed to deserialize shared state '{key}': {e!s}")
             return None
 
@@ -296,12 +744,10 @@ class HemoStatAgent:
             True if successful, False otherwise
         """
         try:
-            full_key = f"hemostat:state:{key}"
-            json_value = json.dumps(value)
-            self.redis.set(full_key, json_value)
-
-            if ttl is not None:
-                self.redis.expire(full_key, ttl)
+            full_key = self._STATE_PREFIX + key
+            json_value = encode_payload(value)
+            # Value and expiry are written atomically in a single command
+            self.redis.set(full_key, json_value, ex=ttl)
 
             self.logger.debug(f"Set shared state '{key}'" + (f" with TTL {ttl}s" if ttl else ""))
             return True
@@ -312,6 +758,37 @@ class HemoStatAgent:
             self.logger.error(f"Failed to set shared state '{key}': {e!s}")
             return False
 
+    def set_shared_states(self, items: list[tuple[str, dict[str, Any], int | None]]) -> bool:
+        """
+        Store several shared state values in a single pipelined round trip.
+
+        Args:
+            items: (key, value, ttl) tuples; keys are prefixed with 'hemostat:state:' and
+                ttl may be None for no expiry
+
+        Returns:
+            True if every value was stored, False otherwise
+        """
+        if not items:
+            return True
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value, ttl in items:
+                pipe.set(self._STATE_PREFIX + key, encode_payload(value), ex=ttl)
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Failed to serialize shared state: {e!s}")
+            return False
+
+        try:
+            pipe.execute()
+        except redis.RedisError as e:
+            self.logger.error(f"Failed to set {len(items)} shared state values: {e!s}")
+            return False
+
+        self.logger.debug(f"Set {len(items)} shared state values")
+        return True
+
     def stop(self) -> None:
         """
         Gracefully shut down the agent.
@@ -319,7 +796,8 @@ class HemoStatAgent:
         Stops the listening loop, unsubscribes from channels, and closes connections.
         """
         self.logger.info("Stopping agent")
-        self._running = False
+        self.running = False
+        self._stop_event.set()
 
         try:
             self.pubsub.unsubscribe()
@@ -335,6 +813,21 @@ class HemoStatAgent:
 
         self.logger.info("Agent stopped successfully")
 
+    def wait_for_stop(self, timeout: float) -> bool:
+        """
+        Sleep for up to timeout seconds, returning early if stop() is called.
+
+        Use in place of time.sleep() between iterations of a run loop so shutdown
+        takes effect immediately instead of after the full interval.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            True if the agent was stopped during the wait, False if the timeout elapsed
+        """
+        return self._stop_event.wait(timeout)
+
     def _handle_shutdown_signal(self, signum: int, frame: Any) -> None:
         """
         Handle OS shutdown signals (SIGTERM, SIGINT).
@@ -369,13 +862,3 @@ class HemoStatAgent:
             redis_port=redis_port,
             redis_db=redis_db,
         )
-
-    @property
-    def is_running(self) -> bool:
-        """
-        Check if the agent is currently running.
-
-        Returns:
-            True if the agent is running, False otherwise
-        """
-        return self._running
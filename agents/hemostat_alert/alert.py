@@ -6,30 +6,219 @@ Sends formatted notifications to Slack webhooks, stores events in Redis for dash
 and implements event deduplication to prevent notification spam.
 """
 
+import functools
 import hashlib
-import json
 import os
+import queue
+import threading
 import time
+from collections import OrderedDict, deque
 from datetime import UTC, datetime
 from typing import Any
 from zoneinfo import ZoneInfo
 
+import orjson
 import requests
 from requests import exceptions as requests_exceptions
+from requests.adapters import HTTPAdapter
 
 from agents.agent_base import HemoStatAgent
 from agents.platform_utils import get_platform_display
 
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - installed with the agents extra (via langgraph)
+    xxhash = None
+
+# Redis keys are kept as bytes: the agent's client runs with decode_responses=False and
+# redis-py sends bytes arguments as-is instead of encoding a str on every command.
+# Unified timeline list that receives every stored event alongside its type-specific list
+_TIMELINE_KEY = b"hemostat:events:all"
+
+# Prefix of the deduplication hashes; each holds the event hashes sent during one
+# dedupe_ttl-wide window of wall-clock time, keyed by the window number
+_ALERT_SENT_PREFIX = b"hemostat:alert_sent:"
+
+# Subscribed channel -> event type its messages are stored and notified as
+_CHANNEL_EVENT_TYPES: dict[str, str] = {
+    "hemostat:remediation_complete": "remediation_complete",
+    "hemostat:false_alarm": "false_alarm",
+    "hemostat:alerts": "vulnerability_alert",
+}
+
+# Type-specific list keys, built once per event type instead of per stored event
+_EVENT_KEYS: dict[str, bytes] = {
+    event_type: f"hemostat:events:{event_type}".encode()
+    for event_type in ("remediation_complete", "false_alarm", "vulnerability_alert")
+}
+
+# Store a batch of events in one server-side call: each event is pushed onto the timeline
+# and its type-specific list, then every touched list is trimmed and its TTL refreshed.
+# Event bytes cross the wire once even though they land in two lists.
+# KEYS[1] = timeline key, KEYS[2..] = type-specific list keys
+# ARGV[1] = max length, ARGV[2] = TTL seconds, then (type key index, value) pairs,
+# oldest first so the newest event ends up at the head of each list
+_STORE_EVENTS_LUA = """
+local timeline = KEYS[1]
+for i = 3, #ARGV, 2 do
+    local event = ARGV[i + 1]
+    redis.call('LPUSH', timeline, event)
+    redis.call('LPUSH', KEYS[tonumber(ARGV[i])], event)
+end
+for _, key in ipairs(KEYS) do
+    redis.call('LTRIM', key, 0, tonumber(ARGV[1]) - 1)
+    redis.call('EXPIRE', key, ARGV[2])
+end
+"""
+
+# Formatted Slack notifications waiting for the sender thread; the oldest is dropped when full
+_SLACK_QUEUE_SIZE = 1024
+
+# Most queued notifications the sender combines into one webhook post as attachments
+_SLACK_BATCH_SIZE = 20
+
+# Display timezone for Slack timestamps, resolved once at import
+_EASTERN = ZoneInfo("America/New_York")
+
+# Upper bound on a rate-limit wait requested by Slack, in seconds
+_MAX_RETRY_AFTER = 30.0
+
+
+def _format_timestamp_et(timestamp_str: str | None) -> tuple[int, str]:
+    """
+    Parse an ISO timestamp once for a Slack attachment.
+
+    Args:
+        timestamp_str: ISO format timestamp (a trailing 'Z' is accepted); falls back to the
+            current time if missing or invalid
+
+    Returns:
+        Tuple of (Unix epoch seconds, Eastern Time display string such as '08:00:30 AM EDT')
+    """
+    try:
+        if timestamp_str.endswith("Z"):
+            timestamp_str = timestamp_str[:-1] + "+00:00"
+        timestamp = datetime.fromisoformat(timestamp_str)
+    except (ValueError, AttributeError):
+        timestamp = datetime.now(UTC)
+
+    # Convert to Eastern Time for display (%Z renders EST or EDT)
+    return int(timestamp.timestamp()), timestamp.astimezone(_EASTERN).strftime("%I:%M:%S %p %Z")
+
+
+def _retry_after_seconds(response: requests.Response, default: float) -> float:
+    """
+    Read the delay requested by a rate-limited response's headers.
+
+    Uses Retry-After (seconds) when present, otherwise X-RateLimit-Reset (epoch
+    seconds at which the limit resets). The result is capped at _MAX_RETRY_AFTER.
+
+    Args:
+        response: HTTP 429 response
+        default: Delay to use if neither header holds a usable number
+
+    Returns:
+        Seconds to wait before retrying
+    """
+    headers = response.headers
+    try:
+        delay = float(headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        try:
+            delay = float(headers["X-RateLimit-Reset"]) - time.time()
+        except (KeyError, TypeError, ValueError):
+            delay = default
+    return min(max(0.0, delay), _MAX_RETRY_AFTER)
+
+
+# Remediation status -> (attachment color, emoji, display text)
+_STATUS_STYLE: dict[str, tuple[str, str, str]] = {
+    "success": ("#36a64f", "✅", "Success"),
+    "failed": ("#ff0000", "❌", "Failed"),
+    "rejected": ("#ff9900", "⏸️", "Rejected"),
+}
+_DEFAULT_STATUS_STYLE = ("#cccccc", "i", "Not Applicable")
+
+# Analysis method -> display indicator (unknown methods are shown as-is)
+_ANALYSIS_INDICATOR: dict[str, str] = {
+    "ai": "🤖 AI-Powered",
+    "rule_based": "📋 Rule-Based",
+}
+
+# Constant parts of each Slack attachment; formatters merge in the per-event fields.
+# Shared field dicts are only serialized, never mutated.
+_REMEDIATION_TEMPLATE: dict[str, Any] = {
+    "pretext": "🤖 *Responder Agent* → Remediation Complete",
+    "footer": "HemoStat • Alert Agent • Remediation Event",
+}
+_FALSE_ALARM_TEMPLATE: dict[str, Any] = {
+    "color": "#ffcc00",
+    "pretext": "🔍 *Analyzer Agent* → False Alarm",
+    "title": "⚠️ False Alarm: No Remediation Required",
+    "footer": "HemoStat • Alert Agent • Analysis Event",
+}
+# Remediation status -> full constant attachment part (template plus status color and title)
+_REMEDIATION_STATUS_TEMPLATES: dict[str, dict[str, Any]] = {
+    status: {
+        **_REMEDIATION_TEMPLATE,
+        "color": color,
+        "title": f"{emoji} Container Remediation: {text}",
+    }
+    for status, (color, emoji, text) in _STATUS_STYLE.items()
+}
+_DEFAULT_REMEDIATION_STATUS_TEMPLATE: dict[str, Any] = {
+    **_REMEDIATION_TEMPLATE,
+    "color": _DEFAULT_STATUS_STYLE[0],
+    "title": f"{_DEFAULT_STATUS_STYLE[1]} Container Remediation: {_DEFAULT_STATUS_STYLE[2]}",
+}
+_REMEDIATION_LEAD_FIELDS: tuple[dict[str, Any], ...] = (
+    {"title": "Event Type", "value": "Remediation Complete", "short": True},
+    {"title": "Source Agent", "value": "Responder", "short": True},
+)
+_FALSE_ALARM_LEAD_FIELDS: tuple[dict[str, Any], ...] = (
+    {"title": "Event Type", "value": "False Alarm", "short": True},
+    {"title": "Source Agent", "value": "Analyzer", "short": True},
+)
+_VULNERABILITY_TEMPLATE: dict[str, Any] = {
+    "color": "#ff0000",  # Red for critical security alerts
+    "pretext": "🔒 *Vulnerability Scanner* → Critical Security Alert",
+    "footer": "HemoStat • Alert Agent • Security Scan",
+}
+
 
 class AlertNotifier(HemoStatAgent):
     """Alert Agent for sending notifications and storing events.
 
     Subscribes to remediation completion and false alarm events,
     sends Slack notifications, and stores events in Redis for dashboard consumption.
-    Implements event deduplication using minute-level timestamps and event type hashing
-    to prevent duplicate notifications within configurable TTL windows.
+    Implements event deduplication by hashing each event's type and content (container,
+    action, status) to prevent duplicate notifications within configurable TTL windows.
     """
 
+    # No per-instance __dict__: HemoStatAgent declares __slots__ as well, so every
+    # attribute read on the handler and flush paths is a fixed-offset slot lookup
+    __slots__ = (
+        "_flush_lock",
+        "_flush_wakeup",
+        "_flusher",
+        "_http",
+        "_pending",
+        "_platform_display",
+        "_queued_hashes",
+        "_sent_hashes",
+        "_slack_enabled",
+        "_slack_queue",
+        "_slack_sender",
+        "_store_script",
+        "alert_enabled",
+        "batch_size",
+        "dedupe_ttl",
+        "event_ttl",
+        "flush_interval",
+        "max_events",
+        "slack_webhook_url",
+    )
+
     def __init__(self):
         """
         Initialize the Alert Agent.
@@ -47,25 +236,70 @@ class AlertNotifier(HemoStatAgent):
         self.alert_enabled = os.getenv("ALERT_ENABLED", "true").lower() == "true"
         self.event_ttl = int(os.getenv("ALERT_EVENT_TTL", "3600"))
         self.max_events = int(os.getenv("ALERT_MAX_EVENTS", "100"))
-        self.dedupe_ttl = int(os.getenv("ALERT_DEDUPE_TTL", "60"))
+        # 0 (or less) disables deduplication; the value also sizes the dedup windows
+        self.dedupe_ttl = max(0, int(os.getenv("ALERT_DEDUPE_TTL", "60")))
+        # Resolved once so handlers skip all notification work with one attribute check
+        # Validated once here; a URL that isn't a Slack incoming webhook disables Slack
+        slack_url_valid = self.slack_webhook_url.startswith("https://hooks.slack.com/")
+        self._slack_enabled = self.alert_enabled and slack_url_valid
+        self.flush_interval = int(os.getenv("ALERT_FLUSH_MS", "50")) / 1000
+        self.batch_size = int(os.getenv("ALERT_BATCH_SIZE", "64"))
+        # Shown in every notification's Environment field; fixed for the process lifetime
+        self._platform_display = get_platform_display()
+
+        # Events waiting to be written to Redis, as (event_type, encoded event) pairs.
+        # Handlers append; the flusher thread drains them in one pipeline per batch.
+        self._pending: deque[tuple[str, bytes]] = deque()
+        self._flush_lock = threading.Lock()
+        # Registered once; redis-py sends EVALSHA and only falls back to loading the
+        # script body if Redis doesn't have it cached yet
+        self._store_script = self.redis.register_script(_STORE_EVENTS_LUA)
+        self._flush_wakeup = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="alert-event-flusher", daemon=True
+        )
+        self._flusher.start()
 
-        # Validate Slack webhook URL if provided
-        if self.slack_webhook_url and not self.slack_webhook_url.startswith(
-            "https://hooks.slack.com/"
-        ):
+        if self.slack_webhook_url and not slack_url_valid:
             self.logger.warning(
-                f"Invalid Slack webhook URL format: {self.slack_webhook_url[:50]}..."
+                f"Invalid Slack webhook URL format: {self.slack_webhook_url[:50]}... "
+                "Slack notifications disabled"
             )
 
-        # Subscribe to all channels
-        self.subscribe_to_channel(
-            "hemostat:remediation_complete", self._handle_remediation_complete
+        # Dedup hashes sent by this process, mapped to their time.monotonic() expiry.
+        # Events whose hash is absent here are treated as new without asking Redis.
+        self._sent_hashes: OrderedDict[str, float] = OrderedDict()
+        # Hashes of notifications queued or being sent. The listener reserves a hash when
+        # it queues a notification and the sender releases it once the post is done, so
+        # repeats arriving mid-send are caught before the send is marked.
+        self._queued_hashes: set[str] = set()
+
+        # Persistent HTTP session so Slack webhook calls reuse pooled keep-alive
+        # connections instead of paying a TCP+TLS handshake per notification.
+        # Every call goes to the one webhook host, so a single host pool is enough.
+        # Retries are handled by _send_webhook_with_retry, not by urllib3.
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0))
+        self._http.headers.update({"Content-Type": "application/json"})
+
+        # Slack posts (and their retry backoff) run on a sender thread so a slow or
+        # rate-limited webhook never stalls pub/sub message handling
+        self._slack_queue: queue.Queue[tuple[dict[str, Any], str, str] | None] = queue.Queue(
+            maxsize=_SLACK_QUEUE_SIZE
         )
-        self.subscribe_to_channel("hemostat:false_alarm", self._handle_false_alarm)
-        self.subscribe_to_channel("hemostat:alerts", self._handle_vulnerability_alert)
+        self._slack_sender: threading.Thread | None = None
+        if self._slack_enabled:
+            self._slack_sender = threading.Thread(
+                target=self._slack_worker, name="alert-slack-sender", daemon=True
+            )
+            self._slack_sender.start()
+
+        # Subscribe to all channels; every channel shares one handler bound to its event type
+        for channel, event_type in _CHANNEL_EVENT_TYPES.items():
+            self.subscribe_to_channel(channel, functools.partial(self._handle_event, event_type))
 
         # Log initialization
-        slack_status = "enabled" if (self.alert_enabled and self.slack_webhook_url) else "disabled"
+        slack_status = "enabled" if self._slack_enabled else "disabled"
         self.logger.info(
             f"Alert Agent initialized - Slack: {slack_status}, "
             f"Event TTL: {self.event_ttl}s, Max Events: {self.max_events}, "
@@ -85,45 +319,35 @@ class AlertNotifier(HemoStatAgent):
             self.logger.error(f"Error in listening loop: {e}", exc_info=True)
             raise
 
-    def _handle_remediation_complete(self, message: dict[str, Any]) -> None:
+    def stop(self) -> None:
         """
-        Handle remediation completion event from Responder Agent.
-
-        Extracts payload and timestamp from message envelope, stores event in Redis,
-        and sends Slack notification if enabled.
-
-        Args:
-            message: Full message wrapper with event_type, timestamp, agent, and data fields
+        Stop the agent, writing queued events and Slack notifications before disconnecting.
         """
-        try:
-            # Extract the inner payload from the envelope
-            payload = message.get("data", {})
-            source_timestamp = message.get("timestamp")
-
-            self.logger.info(
-                f"Received remediation_complete event for container: {payload.get('container', 'unknown')}"
-            )
+        self._stop_event.set()
+        self._flush_wakeup.set()
+        self._flusher.join(timeout=5)
+        self.flush_events()
 
-            # Store event in Redis
-            self._store_event("remediation_complete", payload, source_timestamp)
-
-            # Send Slack notification if enabled
-            if self.alert_enabled:
-                self._send_slack_notification(
-                    payload, event_type="remediation_complete", event_timestamp=source_timestamp
-                )
+        if self._slack_sender is not None:
+            # The sender exits once it reaches this sentinel, after draining earlier items
+            try:
+                self._slack_queue.put(None, timeout=5)
+            except queue.Full:
+                self.logger.warning("Slack queue full at shutdown, pending notifications dropped")
+            self._slack_sender.join(timeout=15)
 
-        except Exception as e:
-            self.logger.error(f"Error handling remediation_complete event: {e}", exc_info=True)
+        self._http.close()
+        super().stop()
 
-    def _handle_false_alarm(self, message: dict[str, Any]) -> None:
+    def _handle_event(self, event_type: str, message: dict[str, Any]) -> None:
         """
-        Handle false alarm event from Analyzer Agent.
+        Handle an event from the Responder, Analyzer, or Vulnerability Scanner Agent.
 
         Extracts payload and timestamp from message envelope, stores event in Redis,
         and sends Slack notification if enabled.
 
         Args:
+            event_type: Stored event type for the message's channel (e.g., 'false_alarm')
             message: Full message wrapper with event_type, timestamp, agent, and data fields
         """
         try:
@@ -131,66 +355,35 @@ class AlertNotifier(HemoStatAgent):
             payload = message.get("data", {})
             source_timestamp = message.get("timestamp")
 
-            self.logger.info(
-                f"Received false_alarm event for container: {payload.get('container', 'unknown')}"
-            )
-
-            # Store event in Redis
-            self._store_event("false_alarm", payload, source_timestamp)
-
-            # Send Slack notification if enabled
-            if self.alert_enabled:
-                self._send_slack_notification(
-                    payload, event_type="false_alarm", event_timestamp=source_timestamp
+            if event_type == "vulnerability_alert":
+                self.logger.info(
+                    f"Received vulnerability alert for {payload.get('target_url', 'unknown')}: "
+                    f"{payload.get('critical_count', 0)} critical vulnerabilities"
+                )
+            else:
+                self.logger.info(
+                    f"Received {event_type} event for container: {payload.get('container', 'unknown')}"
                 )
-
-        except Exception as e:
-            self.logger.error(f"Error handling false_alarm event: {e}", exc_info=True)
-
-    def _handle_vulnerability_alert(self, message: dict[str, Any]) -> None:
-        """
-        Handle vulnerability alert event from Vulnerability Scanner Agent.
-
-        Extracts payload and timestamp from message envelope, stores event in Redis,
-        and sends Slack notification if enabled.
-
-        Args:
-            message: Full message wrapper with event_type, timestamp, agent, and data fields
-        """
-        try:
-            # Extract the inner payload from the envelope
-            payload = message.get("data", {})
-            source_timestamp = message.get("timestamp")
-            event_type = message.get("event_type", "unknown")
-
-            target_url = payload.get("target_url", "unknown")
-            critical_count = payload.get("critical_count", 0)
-            
-            self.logger.info(
-                f"Received vulnerability alert for {target_url}: {critical_count} critical vulnerabilities"
-            )
 
             # Store event in Redis
-            self._store_event("vulnerability_alert", payload, source_timestamp)
+            self._store_event(event_type, payload, source_timestamp)
 
             # Send Slack notification if enabled
-            if self.alert_enabled:
-                self._send_slack_notification(
-                    payload, event_type="vulnerability_alert", event_timestamp=source_timestamp
-                )
+            if self._slack_enabled:
+                self._send_slack_notification(payload, event_type=event_type)
 
         except Exception as e:
-            self.logger.error(f"Error handling vulnerability_alert event: {e}", exc_info=True)
+            self.logger.error(f"Error handling {event_type} event: {e}", exc_info=True)
 
     def _store_event(
         self, event_type: str, payload: dict[str, Any], source_timestamp: str | None = None
     ) -> None:
         """
-        Store event in Redis list for dashboard consumption.
+        Queue event for storage in Redis lists for dashboard consumption.
 
-        Stores events in both type-specific lists and a unified timeline list.
+        Events are written by the flusher thread in batches, within ALERT_FLUSH_MS of being
+        queued or as soon as ALERT_BATCH_SIZE events are waiting.
         Uses source timestamp if available, otherwise uses current time.
-        Maintains max event count and TTL per list.
 
         Args:
             event_type: Type of event (e.g., 'remediation_complete', 'false_alarm')
@@ -209,47 +402,91 @@ class AlertNotifier(HemoStatAgent):
                 "data": payload,
             }
 
-            event_json = json.dumps(event_entry)
-
-            # Store in type-specific list (newest first)
-            self.redis.lpush(f"hemostat:events:{event_type}", event_json)
-            self.redis.ltrim(f"hemostat:events:{event_type}", 0, self.max_events - 1)
-            self.redis.expire(f"hemostat:events:{event_type}", self.event_ttl)
-
-            # Store in unified timeline
-            self.redis.lpush("hemostat:events:all", event_json)
-            self.redis.ltrim("hemostat:events:all", 0, self.max_events - 1)
-            self.redis.expire("hemostat:events:all", self.event_ttl)
+            # orjson-encoded bytes go to Redis as-is. Stored events stay plain JSON (never
+            # compressed) because these lists are read directly with redis-cli LRANGE
+            self._pending.append(
+                (event_type, orjson.dumps(event_entry, option=orjson.OPT_NON_STR_KEYS))
+            )
+            if len(self._pending) >= self.batch_size:
+                self._flush_wakeup.set()
 
             self.logger.debug(
-                f"Event stored: {event_type} for {payload.get('container', 'unknown')}"
+                f"Event queued: {event_type} for {payload.get('container', 'unknown')}"
             )
 
         except Exception as e:
-            self.logger.error(f"Error storing event in Redis: {e}", exc_info=True)
+            self.logger.error(f"Error queueing event for storage: {e}", exc_info=True)
 
-    def _send_slack_notification(
-        self, message: dict[str, Any], event_type: str, event_timestamp: str | None = None
-    ) -> None:
+    def _flush_loop(self) -> None:
+        """
+        Background thread body that flushes queued events until the agent stops.
+        """
+        while not self._stop_event.is_set():
+            self._flush_wakeup.wait(self.flush_interval)
+            self._flush_wakeup.clear()
+            self.flush_events()
+
+    def flush_events(self) -> None:
+        """
+        Write all queued events to Redis with a single script call.
+
+        Stores events in both type-specific lists and a unified timeline list, newest
+        first. The script pushes every event, trims each list to max events, and
+        refreshes its TTL atomically.
+        """
+        with self._flush_lock:
+            if not self._pending:
+                return
+
+            # Each event is sent once, tagged with the (1-based) KEYS index of its type list
+            batch_size = len(self._pending)
+            keys: list[bytes] = [_TIMELINE_KEY]
+            key_indexes: dict[bytes, int] = {}
+            args: list[int | bytes] = [self.max_events, self.event_ttl]
+            for _ in range(batch_size):
+                event_type, event_json = self._pending.popleft()
+                type_key = _EVENT_KEYS.get(event_type)
+                if type_key is None:
+                    type_key = _EVENT_KEYS.setdefault(
+                        event_type, f"hemostat:events:{event_type}".encode()
+                    )
+                key_index = key_indexes.get(type_key)
+                if key_index is None:
+                    keys.append(type_key)
+                    key_index = key_indexes[type_key] = len(keys)
+                args.append(key_index)
+                args.append(event_json)
+
+            try:
+                self._store_script(keys=keys, args=args)
+
+                self.logger.debug(f"Stored {batch_size} event(s) in Redis")
+
+            except Exception as e:
+                self.logger.error(
+                    f"Error storing {batch_size} event(s) in Redis: {e}", exc_info=True
+                )
+
+    def _send_slack_notification(self, message: dict[str, Any], event_type: str) -> None:
         """
         Send formatted notification to Slack webhook.
 
-        Checks if Slack is configured, performs deduplication, formats message
-        based on event type, and sends via webhook with retry logic.
+        Checks if Slack is enabled, performs deduplication, and only then formats the
+        message based on event type and sends it via webhook with retry logic.
 
         Args:
             message: Event message data to format and send
             event_type: Type of event ('remediation_complete' or 'false_alarm')
-            event_timestamp: Optional timestamp for deduplication (ISO format string)
         """
         try:
-            # Check if Slack is configured
-            if not self.slack_webhook_url:
-                self.logger.debug("Slack webhook not configured, skipping notification")
+            # Skip disabled or duplicate notifications before building any payload
+            if not self._slack_enabled:
+                self.logger.debug("Slack notifications disabled, skipping notification")
                 return
-
-            # Check for duplicate events
-            if self._is_duplicate_event(event_type, event_timestamp):
+            # Hashed once: the same key is checked and reserved now, and written after a
+            # successful send
+            event_hash = self._get_event_hash(event_type, message)
+            if self._is_duplicate_event(event_hash):
                 self.logger.debug("Duplicate event detected, skipping Slack notification")
                 return
 
@@ -264,71 +501,165 @@ class AlertNotifier(HemoStatAgent):
                 self.logger.warning(f"Unknown event type: {event_type}")
                 return
 
-            # Send with retry logic (only if payload was successfully formatted)
+            # Hand off to the sender thread (only if payload was successfully formatted)
             if payload:
-                self._send_webhook_with_retry(payload, message, event_type)
+                self._queued_hashes.add(event_hash)
+                self._enqueue_slack((payload, event_type, event_hash))
 
         except Exception as e:
             self.logger.error(f"Error sending Slack notification: {e}", exc_info=True)
 
-    def _send_webhook_with_retry(
-        self, payload: dict[str, Any], message: dict[str, Any], event_type: str | None = None
-    ) -> None:
+    def _enqueue_slack(self, item: tuple[dict[str, Any], str, str]) -> None:
+        """
+        Queue a formatted notification for the sender thread without blocking.
+
+        When the queue is full the oldest waiting notification is dropped so the most
+        recent container state still reaches Slack. While stopping, the new one is
+        dropped instead so stop()'s sentinel is never discarded.
+
+        Args:
+            item: (payload, event_type, event_hash) tuple for _slack_worker()
+        """
+        try:
+            self._slack_queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+
+        if self._stop_event.is_set():
+            self.logger.warning(f"Slack queue full while stopping, dropping {item[1]} notification")
+            self._queued_hashes.discard(item[2])
+            return
+
+        try:
+            dropped = self._slack_queue.get_nowait()
+        except queue.Empty:
+            dropped = None
+        if dropped is not None:
+            self.logger.warning(
+                f"Slack queue full ({_SLACK_QUEUE_SIZE}), dropping oldest {dropped[1]} notification"
+            )
+            self._queued_hashes.discard(dropped[2])
+        try:
+            self._slack_queue.put_nowait(item)
+        except queue.Full:
+            self.logger.warning(f"Slack queue full, dropping {item[1]} notification")
+            self._queued_hashes.discard(item[2])
+
+    def _slack_worker(self) -> None:
+        """
+        Background thread body that sends queued Slack notifications in order.
+
+        Notifications that queued up while the previous post was in flight are sent
+        together as one message with up to _SLACK_BATCH_SIZE attachments. Runs until
+        it receives the None sentinel queued by stop().
+        """
+        stopping = False
+        while not stopping:
+            item = self._slack_queue.get()
+            if item is None:
+                return
+
+            # Coalesce whatever is already waiting; never hold a notification back
+            batch = [item]
+            while len(batch) < _SLACK_BATCH_SIZE:
+                try:
+                    item = self._slack_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            if len(batch) == 1:
+                payload, event_type, event_hash = batch[0]
+                event_hashes = [event_hash]
+            else:
+                payload = {
+                    "attachments": [
+                        attachment for p, _, _ in batch for attachment in p["attachments"]
+                    ]
+                }
+                event_type = f"{len(batch)} batched events"
+                event_hashes = [event_hash for _, _, event_hash in batch]
+
+            # Every notification in the post is marked sent together, then released from
+            # the queued set; hashes of a failed post are released unmarked so a later
+            # repeat of the event is sent
+            try:
+                if self._send_webhook_with_retry(payload, event_type):
+                    self._mark_events_sent(event_hashes)
+            except Exception as e:
+                self.logger.error(f"Error sending Slack notification: {e}", exc_info=True)
+            finally:
+                self._queued_hashes.difference_update(event_hashes)
+
+    def _send_webhook_with_retry(self, payload: dict[str, Any], event_type: str) -> bool:
         """
         Send webhook with exponential backoff retry logic.
 
-        Implements retry logic with exponential backoff for transient failures.
-        Handles rate limiting (429) with longer backoff. Marks successfully sent
-        events in deduplication cache.
+        Implements retry logic with exponential backoff for server errors and network
+        failures. Handles rate limiting (429) by waiting as long as Slack's Retry-After
+        or X-RateLimit-Reset header asks (capped at 30s), falling back to a longer
+        backoff. Other 4xx responses are not retried. Waits end early and retries are
+        abandoned once stop() is called.
 
         Args:
             payload: Formatted Slack message payload
-            message: Original event message
-            event_type: Type of event for deduplication cache
+            event_type: Type of event, for logging
+
+        Returns:
+            True if Slack accepted the message, False if every attempt failed
         """
         max_retries = 3
         base_delay = 1
+        # Serialized once for all attempts; the session already sends the JSON content type
+        body = orjson.dumps(payload)
 
         for attempt in range(max_retries):
             try:
-                response = requests.post(self.slack_webhook_url, json=payload, timeout=10)
+                response = self._http.post(self.slack_webhook_url, data=body, timeout=10)
 
                 if response.status_code == 200:
-                    # Mark as sent in deduplication cache
-                    if event_type:
-                        event_hash = self._get_event_hash(event_type, event_timestamp=None)
-                        self.redis.setex(f"hemostat:alert_sent:{event_hash}", self.dedupe_ttl, "1")
                     self.logger.info(f"Slack notification sent successfully for {event_type}")
-                    return
+                    return True
 
                 elif response.status_code == 429:
                     # Rate limit - use longer backoff
                     if attempt < max_retries - 1:
-                        delay = base_delay * (2**attempt) * 2  # Longer backoff for rate limits
+                        # Prefer Slack's own hint; longer backoff for rate limits otherwise
+                        delay = _retry_after_seconds(response, base_delay * (2**attempt) * 2)
                         self.logger.warning(
                             f"Slack rate limit (429), retrying in {delay}s (attempt {attempt + 1}/{max_retries})"
                         )
-                        time.sleep(delay)
+                        if not self._wait_before_retry(delay):
+                            return False
                     else:
                         self.logger.warning("Slack rate limit (429) - max retries exceeded")
-                        return
+                        return False
 
                 else:
                     self.logger.warning(
                         f"Slack webhook error {response.status_code}: {response.text}"
                     )
+                    # Client errors (bad payload, revoked webhook) fail the same way again
+                    if response.status_code < 500:
+                        return False
                     if attempt < max_retries - 1:
                         delay = base_delay * (2**attempt)
                         self.logger.warning(
                             f"Retrying in {delay}s (attempt {attempt + 1}/{max_retries})"
                         )
-                        time.sleep(delay)
+                        if not self._wait_before_retry(delay):
+                            return False
 
             except requests_exceptions.Timeout:
                 self.logger.warning(f"Slack webhook timeout (attempt {attempt + 1}/{max_retries})")
                 if attempt < max_retries - 1:
                     delay = base_delay * (2**attempt)
-                    time.sleep(delay)
+                    if not self._wait_before_retry(delay):
+                        return False
 
             except requests_exceptions.RequestException as e:
                 self.logger.warning(
@@ -336,7 +667,25 @@ class AlertNotifier(HemoStatAgent):
                 )
                 if attempt < max_retries - 1:
                     delay = base_delay * (2**attempt)
-                    time.sleep(delay)
+                    if not self._wait_before_retry(delay):
+                        return False
+
+        return False
+
+    def _wait_before_retry(self, delay: float) -> bool:
+        """
+        Wait before retrying a Slack webhook call, returning early if the agent stops.
+
+        Args:
+            delay: Seconds to wait
+
+        Returns:
+            True if the retry should go ahead, False if stop() was called during the wait
+        """
+        if self.wait_for_stop(delay):
+            self.logger.warning("Agent stopping, abandoning Slack notification retries")
+            return False
+        return True
 
     def _format_remediation_notification(self, message: dict[str, Any]) -> dict[str, Any] | None:
         """
@@ -369,41 +718,21 @@ class AlertNotifier(HemoStatAgent):
         error_details = result_obj.get("error", "") if isinstance(result_obj, dict) else ""
         rejection_reason = result_obj.get("reason", "") if isinstance(result_obj, dict) else ""
 
-        # Determine color and emoji based on status
-        if status == "success":
-            color = "#36a64f"
-            emoji = "✅"
-            status_text = "Success"
-        elif status == "failed":
-            color = "#ff0000"
-            emoji = "❌"
-            status_text = "Failed"
-        elif status == "rejected":
-            color = "#ff9900"
-            emoji = "⏸️"
-            status_text = "Rejected"
-        else:
-            color = "#cccccc"
-            emoji = "i"
-            status_text = "Not Applicable"
+        # Determine status text and the status-specific color and title
+        status_text = _STATUS_STYLE.get(status, _DEFAULT_STATUS_STYLE)[2]
+        template = _REMEDIATION_STATUS_TEMPLATES.get(status, _DEFAULT_REMEDIATION_STATUS_TEMPLATE)
 
         # Format analysis method with indicator
-        if analysis_method == "ai":
-            ai_indicator = "🤖 AI-Powered"
-        elif analysis_method == "rule_based":
-            ai_indicator = "📋 Rule-Based"
-        else:
-            ai_indicator = analysis_method
+        ai_indicator = _ANALYSIS_INDICATOR.get(analysis_method, analysis_method)
 
         # Build fields
         fields = [
-            {"title": "Event Type", "value": "Remediation Complete", "short": True},
-            {"title": "Source Agent", "value": "Responder", "short": True},
+            *_REMEDIATION_LEAD_FIELDS,
             {"title": "Container", "value": container, "short": True},
             {"title": "Action", "value": action, "short": True},
             {"title": "Status", "value": status_text, "short": True},
             {"title": "Analysis", "value": ai_indicator, "short": True},
-            {"title": "Environment", "value": get_platform_display(), "short": True},
+            {"title": "Environment", "value": self._platform_display, "short": True},
         ]
 
         if reason:
@@ -422,32 +751,16 @@ class AlertNotifier(HemoStatAgent):
             fields.append({"title": "Error", "value": error_details, "short": False})
 
         # Get timestamp from message or use current time
-        timestamp_str = message.get("timestamp", datetime.now(UTC).isoformat())
-        try:
-            timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            ts = int(timestamp.timestamp())
-            # Convert to Eastern Time for display
-            eastern = ZoneInfo("America/New_York")
-            timestamp_et = timestamp.astimezone(eastern)
-            tz_abbr = timestamp_et.strftime("%Z")  # EST or EDT
-            time_display = timestamp_et.strftime(f"%I:%M:%S %p {tz_abbr}")
-        except (ValueError, AttributeError):
-            ts = int(datetime.now(UTC).timestamp())
-            now_et = datetime.now(ZoneInfo("America/New_York"))
-            tz_abbr = now_et.strftime("%Z")
-            time_display = now_et.strftime(f"%I:%M:%S %p {tz_abbr}")
+        ts, time_display = _format_timestamp_et(message.get("timestamp"))
 
         # Add timestamp field
         fields.append({"title": "Timestamp", "value": time_display, "short": True})
 
         # Build attachment with enhanced metadata
         attachment = {
-            "fallback": f"{emoji} Container Remediation: {status_text} - {container}",
-            "color": color,
-            "pretext": "🤖 *Responder Agent* → Remediation Complete",
-            "title": f"{emoji} Container Remediation: {status_text}",
+            **template,
+            "fallback": f"{template['title']} - {container}",
             "fields": fields,
-            "footer": "HemoStat • Alert Agent • Remediation Event",
             "ts": ts,
         }
 
@@ -472,20 +785,14 @@ class AlertNotifier(HemoStatAgent):
         analysis_method = message.get("analysis_method", "unknown")
 
         # Format analysis method with indicator
-        if analysis_method == "ai":
-            ai_indicator = "🤖 AI-Powered"
-        elif analysis_method == "rule_based":
-            ai_indicator = "📋 Rule-Based"
-        else:
-            ai_indicator = analysis_method
+        ai_indicator = _ANALYSIS_INDICATOR.get(analysis_method, analysis_method)
 
         # Build fields
         fields = [
-            {"title": "Event Type", "value": "False Alarm", "short": True},
-            {"title": "Source Agent", "value": "Analyzer", "short": True},
+            *_FALSE_ALARM_LEAD_FIELDS,
             {"title": "Container", "value": container, "short": True},
             {"title": "Analysis", "value": ai_indicator, "short": True},
-            {"title": "Environment", "value": get_platform_display(), "short": True},
+            {"title": "Environment", "value": self._platform_display, "short": True},
         ]
 
         if reason:
@@ -495,32 +802,16 @@ class AlertNotifier(HemoStatAgent):
             fields.append({"title": "Confidence", "value": f"{confidence:.1%}", "short": True})
 
         # Get timestamp from message or use current time
-        timestamp_str = message.get("timestamp", datetime.now(UTC).isoformat())
-        try:
-            timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            ts = int(timestamp.timestamp())
-            # Convert to Eastern Time for display
-            eastern = ZoneInfo("America/New_York")
-            timestamp_et = timestamp.astimezone(eastern)
-            tz_abbr = timestamp_et.strftime("%Z")  # EST or EDT
-            time_display = timestamp_et.strftime(f"%I:%M:%S %p {tz_abbr}")
-        except (ValueError, AttributeError):
-            ts = int(datetime.now(UTC).timestamp())
-            now_et = datetime.now(ZoneInfo("America/New_York"))
-            tz_abbr = now_et.strftime("%Z")
-            time_display = now_et.strftime(f"%I:%M:%S %p {tz_abbr}")
+        ts, time_display = _format_timestamp_et(message.get("timestamp"))
 
         # Add timestamp field
         fields.append({"title": "Timestamp", "value": time_display, "short": True})
 
         # Build attachment with enhanced metadata
         attachment = {
+            **_FALSE_ALARM_TEMPLATE,
             "fallback": f"⚠️ False Alarm: {container} - No action needed",
-            "color": "#ffcc00",
-            "pretext": "🔍 *Analyzer Agent* → False Alarm",
-            "title": "⚠️ False Alarm: No Remediation Required",
             "fields": fields,
-            "footer": "HemoStat • Alert Agent • Analysis Event",
             "ts": ts,
         }
 
@@ -578,80 +869,109 @@ class AlertNotifier(HemoStatAgent):
             })
 
         # Add timestamp field
-        timestamp_str = message.get("timestamp")
-        try:
-            timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            ts = int(timestamp.timestamp())
-            # Convert to Eastern Time for display
-            eastern = ZoneInfo("America/New_York")
-            timestamp_et = timestamp.astimezone(eastern)
-            tz_abbr = timestamp_et.strftime("%Z")  # EST or EDT
-            time_display = timestamp_et.strftime(f"%I:%M:%S %p {tz_abbr}")
-        except (ValueError, AttributeError):
-            ts = int(datetime.now(UTC).timestamp())
-            now_et = datetime.now(ZoneInfo("America/New_York"))
-            tz_abbr = now_et.strftime("%Z")
-            time_display = now_et.strftime(f"%I:%M:%S %p {tz_abbr}")
+        ts, time_display = _format_timestamp_et(message.get("timestamp"))
 
         fields.append({"title": "Scan Time", "value": time_display, "short": True})
 
         # Build attachment with critical vulnerability styling
         attachment = {
+            **_VULNERABILITY_TEMPLATE,
             "fallback": f"🚨 CRITICAL: {critical_count} vulnerabilities found in {target_url}",
-            "color": "#ff0000",  # Red for critical security alerts
-            "pretext": "🔒 *Vulnerability Scanner* → Critical Security Alert",
             "title": f"🚨 {critical_count} Critical Vulnerabilities Detected",
             "title_link": target_url if target_url.startswith("http") else None,
             "fields": fields,
-            "footer": "HemoStat • Alert Agent • Security Scan",
             "ts": ts,
         }
 
         return {"attachments": [attachment]}
 
-    def _is_duplicate_event(self, event_type: str, event_timestamp: str | None = None) -> bool:
+    def _is_duplicate_event(self, event_hash: str) -> bool:
         """
         Check if event was recently sent to avoid duplicate notifications.
 
-        Uses minute-level timestamp granularity and event type to generate hash.
-        Checks Redis cache for recent sends within dedupe_ttl window.
+        Notifications still queued or being sent count as duplicates. Hashes this process
+        has not sent recently are reported as new without a Redis round trip; otherwise
+        the Redis cache is checked for sends within dedupe_ttl.
 
         Args:
-            event_type: Type of event ('remediation_complete' or 'false_alarm')
-            event_timestamp: Optional timestamp for deduplication (ISO format string)
+            event_hash: Hash from _get_event_hash() (event type and content)
 
         Returns:
-            True if event was recently sent, False otherwise
+            True if event was recently sent, False otherwise (always False when
+            deduplication is disabled)
+        """
+        if not self.dedupe_ttl:
+            return False
+        if event_hash in self._queued_hashes:
+            return True
+
+        expires_at = self._sent_hashes.get(event_hash)
+        if expires_at is None or expires_at <= time.monotonic():
+            return False
+
+        # A send within dedupe_ttl landed in the current window or the one before it
+        window = int(time.time()) // self.dedupe_ttl
+        field = event_hash.encode()
+        with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hexists(_ALERT_SENT_PREFIX + str(window).encode(), field)
+            pipe.hexists(_ALERT_SENT_PREFIX + str(window - 1).encode(), field)
+            return any(pipe.execute())
+
+    def _mark_events_sent(self, event_hashes: list[str]) -> None:
         """
-        event_hash = self._get_event_hash(event_type, event_timestamp)
-        cache_key = f"hemostat:alert_sent:{event_hash}"
-        return bool(self.redis.get(cache_key))
+        Record sent notifications in the local and Redis deduplication caches.
 
-    def _get_event_hash(self, event_type: str, event_timestamp: str | None = None) -> str:
+        Args:
+            event_hashes: Hashes from _get_event_hash() for the sent events
+        """
+        if not self.dedupe_ttl:
+            return
+
+        # One hash per window instead of one key per notification; it must outlive the
+        # following window, which still checks it
+        key = _ALERT_SENT_PREFIX + str(int(time.time()) // self.dedupe_ttl).encode()
+        with self.redis.pipeline(transaction=False) as pipe:
+            for event_hash in event_hashes:
+                pipe.hsetnx(key, event_hash.encode(), b"1")
+            pipe.expire(key, 2 * self.dedupe_ttl)
+            pipe.execute()
+
+        now = time.monotonic()
+        # Entries share one TTL, so insertion order is expiry order: drop expired
+        # entries from the front to keep the cache bounded by the dedup window
+        sent = self._sent_hashes
+        while sent and next(iter(sent.values())) <= now:
+            sent.popitem(last=False)
+        for event_hash in event_hashes:
+            sent[event_hash] = now + self.dedupe_ttl
+            sent.move_to_end(event_hash)
+
+    def _get_event_hash(self, event_type: str, payload: dict[str, Any]) -> str:
         """
         Generate deterministic hash for event deduplication.
 
-        Creates hash from event type and minute-level timestamp to allow
-        deduplication of duplicate events within the same minute.
+        Creates hash from the event type and what the event is about: the container
+        (or scanned URL for vulnerability alerts), action, and result status. Identical
+        events are deduplicated for dedupe_ttl however their timestamps fall, while
+        events for other containers or outcomes are never suppressed.
 
         Args:
             event_type: Type of event
-            event_timestamp: Optional timestamp (ISO format string)
+            payload: Event data payload
 
         Returns:
-            MD5 hash string for deduplication cache key
+            16-character hex digest (64-bit xxHash, or BLAKE2b without xxhash) for
+            deduplication cache key
         """
-        # Use provided timestamp or current time, rounded to minute
-        timestamp = event_timestamp or datetime.now(UTC).isoformat()
-        if isinstance(timestamp, str):
-            try:
-                dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                minute_timestamp = dt.replace(second=0, microsecond=0).isoformat()
-            except (ValueError, AttributeError):
-                minute_timestamp = datetime.now(UTC).replace(second=0, microsecond=0).isoformat()
-        else:
-            minute_timestamp = datetime.now(UTC).replace(second=0, microsecond=0).isoformat()
-
-        # Create hash from event_type and timestamp
-        hash_input = f"{event_type}:{minute_timestamp}"
-        return hashlib.md5(hash_input.encode()).hexdigest()
+        subject = payload.get("container") or payload.get("target_url") or ""
+        result = payload.get("result")
+        status = result.get("status", "") if isinstance(result, dict) else ""
+
+        # The time window comes from the dedup cache TTL, not from the hash. A 64-bit
+        # digest is plenty for the handful of keys live per window; xxHash is a
+        # non-cryptographic C hash with the least per-call overhead, BLAKE2b is the
+        # stdlib fallback.
+        hash_input = f"{event_type}:{subject}:{payload.get('action', '')}:{status}"
+        if xxhash is not None:
+            return xxhash.xxh64_hexdigest(hash_input)
+        return hashlib.blake2b(hash_input.encode(), digest_size=8).hexdigest()
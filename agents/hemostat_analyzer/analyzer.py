@@ -6,13 +6,155 @@ Claude/GPT-4, distinguishes real issues from false alarms, calculates confidence
 and publishes remediation recommendations or false alarm notifications.
 """
 
+import functools
+import hashlib
 import json
 import os
+import queue
+import random
 import re
+import threading
 import time
-from typing import Any
+from collections import OrderedDict
+from typing import Annotated, Any, Literal, TypedDict
 
-from agents.agent_base import HemoStatAgent
+import orjson
+import redis
+
+from agents.agent_base import HemoStatAgent, decode_payload, encode_payload
+
+# Alerts waiting for the AI batch worker; when full, new alerts are analyzed by rules inline
+_ALERT_QUEUE_SIZE = 1024
+
+# LLM attempts per alert before falling back to rule-based analysis
+_AI_MAX_RETRIES = 3
+
+# Rule-based verdicts at or above this confidence are used as-is, without asking the LLM
+_RULE_FAST_PATH_CONFIDENCE = 0.85
+
+# Most AI analyses kept in the process-local answer cache
+_ANALYSIS_CACHE_SIZE = 256
+
+# Markdown code fences some models wrap JSON answers in, compiled once
+_FENCE_HEAD = re.compile(r"^```(?:json)?\s*")
+_FENCE_TAIL = re.compile(r"\s*```$")
+_JSON_DECODER = json.JSONDecoder()
+
+# Static instructions sent as the system message of every analysis request. Keeping them
+# identical across calls lets providers reuse the cached prompt prefix.
+_SYSTEM_PROMPT = """You are an expert DevOps engineer analyzing container health issues.
+
+Respond with valid JSON only, no code fences or commentary. Provide your analysis in this format:
+{{
+  "root_cause": "Brief description of the root cause",
+  "action": "restart|scale_up|cleanup|none",
+  "reason": "Explanation for the recommended action",
+  "confidence": 0.0-1.0,
+  "is_false_alarm": true|false
+}}
+
+Be concise and focus on actionable insights."""
+
+# Per-alert part of the request; placeholders are filled by _build_prompt_inputs
+_ALERT_PROMPT = """Container: {container_name}
+Health Status: {health_status}
+
+Current Metrics:
+- CPU: {cpu_percent}%
+- Memory: {memory_percent}%
+- Network I/O: {network_io}
+- Disk I/O: {disk_io}
+- Exit Code: {exit_code}
+- Restart Count: {restart_count}
+
+Detected Anomalies ({anomaly_count}):
+{anomalies}
+{history_summary}"""
+
+# AI recommendations safe to reuse for a similar alert without asking the LLM again
+_CACHEABLE_ACTIONS = frozenset({"none", "restart"})
+
+
+class HealthAnalysis(TypedDict):
+    """Root cause analysis of a container health alert."""
+
+    root_cause: Annotated[str, ..., "Brief description of the root cause"]
+    action: Annotated[
+        Literal["restart", "scale_up", "cleanup", "none"], ..., "Recommended remediation action"
+    ]
+    reason: Annotated[str, ..., "Explanation for the recommended action"]
+    confidence: Annotated[float, ..., "Confidence in the analysis, 0.0-1.0"]
+    is_false_alarm: Annotated[bool, ..., "Whether the alert is a false alarm"]
+
+
+# Fields an AI analysis must carry, and the types the routing logic relies on
+_AI_RESULT_TYPES: dict[str, type | tuple[type, ...]] = {
+    "root_cause": str,
+    "action": str,
+    "reason": str,
+    "confidence": (int, float),
+    "is_false_alarm": bool,
+}
+
+# Most distinct (type, severity) anomaly groups shown to the LLM, most severe first
+_PROMPT_MAX_ANOMALY_GROUPS = 8
+_SEVERITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+
+@functools.lru_cache(maxsize=4)
+def _make_llm(model: str, endpoint_url: str, token_fingerprint: str) -> Any:
+    """
+    Construct the LangChain model client for a model configuration, once per process.
+
+    Provider modules are imported on first use only. The cache lets analyzers created
+    later in the same process (restarts in tests or a shared runner) reuse the client.
+
+    Args:
+        model: AI_MODEL value; "gpt*" uses OpenAI, "claude*" Anthropic, "org/name"
+            Hugging Face
+        endpoint_url: Custom Hugging Face endpoint URL, or "" for the Inference API
+        token_fingerprint: Short hash of the provider API key, so a rotated key gets a
+            new client without the cache key holding the secret
+
+    Returns:
+        ChatOpenAI, ChatAnthropic or HuggingFaceEndpoint instance
+
+    Raises:
+        ImportError: If the provider's LangChain package is not installed
+    """
+    if model.startswith("gpt"):
+        from langchain_openai import ChatOpenAI
+
+        return ChatOpenAI(
+            model=model,  # type: ignore[arg-type]
+            temperature=0.3,
+        )
+
+    if model.startswith("claude"):
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic(
+            model=model,
+            temperature=0.3,
+        )
+
+    from langchain_huggingface import HuggingFaceEndpoint
+
+    hf_token = os.getenv("HUGGINGFACE_API_KEY") or os.getenv("HF_TOKEN", "")
+    if endpoint_url:
+        return HuggingFaceEndpoint(
+            endpoint_url=endpoint_url,
+            task="text-generation",
+            temperature=0.3,
+            max_new_tokens=512,
+            huggingfacehub_api_token=hf_token,
+        )
+    return HuggingFaceEndpoint(
+        repo_id=model,
+        temperature=0.3,
+        max_new_tokens=512,
+        huggingfacehub_api_token=hf_token,
+    )
 
 
 class HealthAnalyzer(HemoStatAgent):
@@ -42,9 +184,30 @@ class HealthAnalyzer(HemoStatAgent):
         self.confidence_threshold = float(os.getenv("ANALYZER_CONFIDENCE_THRESHOLD", 0.7))
         self.history_size = int(os.getenv("ANALYZER_HISTORY_SIZE", 10))
         self.history_ttl = int(os.getenv("ANALYZER_HISTORY_TTL", 3600))
+        # AI batching: alerts arriving within ANALYZER_BATCH_WAIT_MS of each other are
+        # analyzed together, with up to ANALYZER_AI_CONCURRENCY LLM calls in flight
+        self.batch_size = int(os.getenv("ANALYZER_BATCH_SIZE", 16))
+        self.batch_wait = int(os.getenv("ANALYZER_BATCH_WAIT_MS", 100)) / 1000
+        self.ai_concurrency = int(os.getenv("ANALYZER_AI_CONCURRENCY", 8))
+        # AI answers are reused for near-identical alerts for this many seconds (0 disables)
+        self.analysis_cache_ttl = int(os.getenv("ANALYZER_CACHE_TTL", 300))
+        # Cache key -> (time.monotonic() expiry, analysis), oldest first
+        self._analysis_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
 
         # Initialize LLM (skip if AI is disabled)
         self.llm = None if not self.ai_enabled else self._initialize_llm()
+        self.chain = self._build_chain() if self.llm else None
+
+        # LLM calls run on a worker thread so the pub/sub listener never waits on them
+        self._alert_queue: queue.Queue[dict[str, Any] | None] = queue.Queue(
+            maxsize=_ALERT_QUEUE_SIZE
+        )
+        self._ai_worker: threading.Thread | None = None
+        if self.llm:
+            self._ai_worker = threading.Thread(
+                target=self._ai_batch_worker, name="analyzer-ai-worker", daemon=True
+            )
+            self._ai_worker.start()
 
         # Subscribe to health alerts
         self.subscribe_to_channel("hemostat:health_alert", self._handle_health_alert)
@@ -65,41 +228,30 @@ class HealthAnalyzer(HemoStatAgent):
             ImportError: If required LangChain libraries are not installed
         """
         try:
+            endpoint_url = ""
             if self.ai_model.startswith("gpt"):
-                from langchain_openai import ChatOpenAI
-
-                if not os.getenv("OPENAI_API_KEY", "").strip():
+                token = os.getenv("OPENAI_API_KEY", "")
+                if not token.strip():
                     self.logger.warning(
                         "OPENAI_API_KEY not set; AI analysis disabled (using rule-based fallback)"
                     )
                     return None
 
                 self.logger.info(f"Initializing ChatOpenAI with model: {self.ai_model}")
-                return ChatOpenAI(
-                    model=self.ai_model,  # type: ignore[arg-type]
-                    temperature=0.3,
-                )
 
             elif self.ai_model.startswith("claude"):
-                from langchain_anthropic import ChatAnthropic
-
-                if not os.getenv("ANTHROPIC_API_KEY", "").strip():
+                token = os.getenv("ANTHROPIC_API_KEY", "")
+                if not token.strip():
                     self.logger.warning(
                         "ANTHROPIC_API_KEY not set; AI analysis disabled (using rule-based fallback)"
                     )
                     return None
 
                 self.logger.info(f"Initializing ChatAnthropic with model: {self.ai_model}")
-                return ChatAnthropic(  
-                    model=self.ai_model,
-                    temperature=0.3,
-                )
 
             elif "/" in self.ai_model:  # Hugging Face model (e.g., "openai/gpt-oss-120b")
-                from langchain_huggingface import HuggingFaceEndpoint
-
-                hf_token = os.getenv("HUGGINGFACE_API_KEY") or os.getenv("HF_TOKEN", "")
-                if not hf_token.strip():
+                token = os.getenv("HUGGINGFACE_API_KEY") or os.getenv("HF_TOKEN", "")
+                if not token.strip():
                     self.logger.warning(
                         "HUGGINGFACE_API_KEY or HF_TOKEN not set; AI analysis disabled (using rule-based fallback)"
                     )
@@ -107,31 +259,23 @@ class HealthAnalyzer(HemoStatAgent):
 
                 # Check for custom endpoint URL (for models not on serverless Inference API)
                 endpoint_url = os.getenv("HF_ENDPOINT_URL", "").strip()
-                
+
                 if endpoint_url:
                     self.logger.info(
                         f"Initializing HuggingFaceEndpoint with model: {self.ai_model} at custom endpoint: {endpoint_url}"
                     )
-                    return HuggingFaceEndpoint(
-                        endpoint_url=endpoint_url,
-                        task="text-generation",
-                        temperature=0.3,
-                        max_new_tokens=512,
-                        huggingfacehub_api_token=hf_token,
-                    )
                 else:
-                    self.logger.info(f"Initializing HuggingFaceEndpoint with model: {self.ai_model}")
-                    return HuggingFaceEndpoint(
-                        repo_id=self.ai_model,
-                        temperature=0.3,
-                        max_new_tokens=512,
-                        huggingfacehub_api_token=hf_token,
+                    self.logger.info(
+                        f"Initializing HuggingFaceEndpoint with model: {self.ai_model}"
                     )
 
             else:
                 self.logger.warning(f"Unknown AI model: {self.ai_model}; using rule-based fallback")
                 return None
 
+            token_fingerprint = hashlib.sha256(token.encode()).hexdigest()[:8]
+            return _make_llm(self.ai_model, endpoint_url, token_fingerprint)
+
         except ImportError as e:
             self.logger.error(
                 f"Failed to import LangChain libraries: {e}. Install with: uv sync --extra agents"
@@ -141,6 +285,30 @@ class HealthAnalyzer(HemoStatAgent):
             self.logger.error(f"Failed to initialize LLM: {e}")
             return None
 
+    def _build_chain(self) -> Any:
+        """
+        Compose the prompt template and LLM into one runnable.
+
+        Chat models with tool calling (OpenAI, Anthropic) use structured output, so the
+        provider returns the analysis fields directly. Other models (Hugging Face
+        endpoints) fall back to a string output parser and client-side JSON parsing.
+
+        Returns:
+            LangChain runnable mapping prompt inputs (see _build_prompt_inputs) to an
+            analysis dict, or to the raw response text for the fallback
+        """
+        from langchain_core.output_parsers import StrOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
+
+        prompt = ChatPromptTemplate.from_messages(
+            [("system", _SYSTEM_PROMPT), ("human", _ALERT_PROMPT)]
+        )
+        try:
+            return prompt | self.llm.with_structured_output(HealthAnalysis)
+        except NotImplementedError:
+            self.logger.info("Structured output not supported by model; parsing JSON responses")
+            return prompt | self.llm | StrOutputParser()
+
     def run(self) -> None:
         """
         Start the analyzer listening loop.
@@ -152,10 +320,31 @@ class HealthAnalyzer(HemoStatAgent):
         except Exception as e:
             self.logger.error(f"Error in listening loop: {e}", exc_info=True)
 
+    def stop(self) -> None:
+        """
+        Stop the agent, finishing queued analyses before disconnecting.
+
+        Alerts still queued when stop() is called are analyzed with the rules only.
+        """
+        self._stop_event.set()
+
+        if self._ai_worker is not None:
+            # The worker exits once it reaches this sentinel, after draining earlier alerts
+            try:
+                self._alert_queue.put(None, timeout=5)
+            except queue.Full:
+                self.logger.warning("Analysis queue full at shutdown, pending alerts dropped")
+            self._ai_worker.join(timeout=30)
+
+        super().stop()
+
     def _handle_health_alert(self, message: dict[str, Any]) -> None:
         """
         Callback invoked when a health alert is received from Monitor Agent.
 
+        With AI enabled the alert is queued for the batch worker; otherwise it is
+        analyzed immediately with the rules.
+
         Args:
             message: Deserialized health alert message from Redis
         """
@@ -170,221 +359,527 @@ class HealthAnalyzer(HemoStatAgent):
             )
 
             # Perform analysis
-            self._analyze_health_issue(alert_data)
+            if self._ai_worker is None:
+                self._analyze_health_issues([alert_data])
+                return
+
+            try:
+                self._alert_queue.put_nowait(alert_data)
+            except queue.Full:
+                self.logger.warning(
+                    f"Analysis queue full ({_ALERT_QUEUE_SIZE}); analyzing {container_name} "
+                    "with rule-based logic only"
+                )
+                self._analyze_health_issues([alert_data], use_ai=False)
 
         except Exception as e:
             self.logger.error(f"Error handling health alert: {e}", exc_info=True)
 
-    def _analyze_health_issue(self, alert_data: dict[str, Any]) -> None:
+    def _ai_batch_worker(self) -> None:
+        """
+        Background thread body that analyzes queued alerts in batches.
+
+        Takes the first waiting alert plus any others arriving within ANALYZER_BATCH_WAIT_MS,
+        up to ANALYZER_BATCH_SIZE, and analyzes them together. Runs until it receives the
+        None sentinel queued by stop().
+        """
+        stopping = False
+        while not stopping:
+            alert_data = self._alert_queue.get()
+            if alert_data is None:
+                return
+
+            batch = [alert_data]
+            deadline = time.monotonic() + self.batch_wait
+            while len(batch) < self.batch_size:
+                try:
+                    alert_data = self._alert_queue.get(
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+                except queue.Empty:
+                    break
+                if alert_data is None:
+                    stopping = True
+                    break
+                batch.append(alert_data)
+
+            try:
+                # Once stopping, skip the LLM so shutdown isn't held up by slow calls
+                self._analyze_health_issues(batch, use_ai=not self._stop_event.is_set())
+            except Exception as e:
+                self.logger.error(f"Error analyzing alert batch: {e}", exc_info=True)
+
+    def _analyze_health_issues(self, alerts: list[dict[str, Any]], use_ai: bool = True) -> None:
         """
         Main analysis orchestration method.
 
-        Retrieves historical context, attempts AI analysis, falls back to rule-based
-        if needed, and routes to appropriate channel based on confidence.
+        Retrieves historical context and applies the rules to every alert. Crashed and
+        restart-storming containers are settled by the rules alone, without fetching
+        history. Other alerts the rules cannot settle with high confidence get AI
+        analysis, all at once, falling back to the rule-based verdict if needed. Each
+        alert is then routed to the appropriate channel based on confidence.
+
+        Args:
+            alerts: Health alert data from Monitor Agent, in arrival order
+            use_ai: Whether to try AI analysis before the rules (if an LLM is available)
+        """
+        decided = [self._decided_without_history(alert_data) for alert_data in alerts]
+
+        # Each alert sees the history as of its arrival, including earlier alerts for
+        # the same container in this batch. History is only fetched for containers
+        # with at least one alert the rules need it for.
+        histories = self._get_alert_histories(
+            {
+                alert_data.get("container_name", "unknown")
+                for alert_data, is_decided in zip(alerts, decided, strict=True)
+                if not is_decided
+            }
+        )
+        contexts: list[tuple[dict[str, Any], list[dict]]] = []
+        for alert_data, is_decided in zip(alerts, decided, strict=True):
+            container_name = alert_data.get("container_name", "unknown")
+            history_list = histories.get(container_name)
+            contexts.append(
+                (alert_data, [] if is_decided or history_list is None else history_list)
+            )
+            if history_list is not None:
+                histories[container_name] = [*history_list, alert_data][-self.history_size :]
+
+        rule_results = [
+            self._rule_based_analyze(alert_data, history_list)
+            for alert_data, history_list in contexts
+        ]
+
+        # Attempt AI analysis if LLM is available, skipping alerts the rules are sure about
+        ai_results: list[dict[str, Any] | None] = [None] * len(contexts)
+        if use_ai and self.llm:
+            escalate = [
+                i
+                for i, rule_result in enumerate(rule_results)
+                if not decided[i] and rule_result["confidence"] < _RULE_FAST_PATH_CONFIDENCE
+            ]
+            if len(escalate) < len(contexts):
+                self.logger.debug(
+                    f"Rule-based fast path settled {len(contexts) - len(escalate)} of "
+                    f"{len(contexts)} alerts without AI"
+                )
+            if escalate:
+                escalated = self._cached_ai_analyze([contexts[i] for i in escalate])
+                for i, analysis in zip(escalate, escalated, strict=True):
+                    ai_results[i] = analysis
+
+        # Outgoing events for the whole batch are published in one pipelined round trip
+        events: list[tuple[str, str, dict[str, Any]]] = []
+        for (alert_data, _), analysis, rule_result in zip(
+            contexts, ai_results, rule_results, strict=True
+        ):
+            container_name = alert_data.get("container_name", "unknown")
+            try:
+                # Fall back to rule-based if AI failed, was skipped or not available
+                if analysis is None:
+                    analysis = rule_result
+
+                # Update alert history
+                self._update_alert_history(container_name, alert_data)
+
+                events.append(self._route_analysis(alert_data, analysis))
+
+            except Exception as e:
+                self.logger.error(
+                    f"Error analyzing health issue for {container_name}: {e}", exc_info=True
+                )
+
+        self.publish_events(events)
+
+    @staticmethod
+    def _decided_without_history(alert_data: dict[str, Any]) -> bool:
+        """
+        Check whether the history-free rules (non-zero exit, restart storm) settle an alert.
+
+        Such alerts skip both the history fetch and AI analysis.
 
         Args:
             alert_data: Health alert data from Monitor Agent
+
+        Returns:
+            True if rule 1 or rule 2 of _rule_based_analyze() applies
         """
-        container_name = alert_data.get("container_name", "unknown")
+        return alert_data.get("exit_code", 0) != 0 or alert_data.get("restart_count", 0) > 5
 
-        try:
-            # Retrieve historical context
-            history = self.get_shared_state(f"alert_history:{container_name}")
-            history_list = history.get("alerts", []) if history else []
+    def _route_analysis(
+        self, alert_data: dict[str, Any], analysis: dict[str, Any]
+    ) -> tuple[str, str, dict[str, Any]]:
+        """
+        Build the event for an analysis result on the appropriate channel.
 
-            # Attempt AI analysis if LLM is available
-            analysis = None
-            if self.llm:
-                analysis = self._ai_analyze(alert_data, history_list)
+        Args:
+            alert_data: Health alert data from Monitor Agent
+            analysis: Analysis result from AI or rule-based logic
 
-            # Fall back to rule-based if AI failed or not available
-            if analysis is None:
-                analysis = self._rule_based_analyze(alert_data, history_list)
-
-            # Update alert history
-            self._update_alert_history(container_name, alert_data)
-
-            # Route to appropriate channel based on confidence and action
-            if analysis.get("is_false_alarm"):
-                self._publish_false_alarm(alert_data, analysis)
-            elif analysis.get("confidence", 0) >= self.confidence_threshold:
-                # Guard: only publish remediation if action is actionable (not "none")
-                if analysis.get("action") != "none":
-                    self._publish_remediation_needed(alert_data, analysis)
-                else:
-                    # Action is "none" even with high confidence; treat as false alarm
-                    self._publish_false_alarm(alert_data, analysis)
+        Returns:
+            (channel, event_type, payload) tuple for publish_events()
+        """
+        # Route to appropriate channel based on confidence and action
+        if analysis.get("is_false_alarm"):
+            return self._false_alarm_event(alert_data, analysis)
+        elif analysis.get("confidence", 0) >= self.confidence_threshold:
+            # Guard: only publish remediation if action is actionable (not "none")
+            if analysis.get("action") != "none":
+                return self._remediation_needed_event(alert_data, analysis)
             else:
-                self._publish_false_alarm(alert_data, analysis)
+                # Action is "none" even with high confidence; treat as false alarm
+                return self._false_alarm_event(alert_data, analysis)
+        else:
+            return self._false_alarm_event(alert_data, analysis)
+
+    def _cached_ai_analyze(
+        self, contexts: list[tuple[dict[str, Any], list[dict]]]
+    ) -> list[dict[str, Any] | None]:
+        """
+        Perform AI analysis with an answer cache in front of the LLM.
 
-        except Exception as e:
-            self.logger.error(
-                f"Error analyzing health issue for {container_name}: {e}", exc_info=True
-            )
+        Alerts with the same cache key (see _analysis_cache_key()) reuse a recent AI
+        analysis: the process-local cache is checked first, then Redis. Among the
+        remaining alerts, only the first per distinct key is sent to the LLM.
+
+        Args:
+            contexts: (alert_data, history) pairs, as for _ai_analyze_batch()
 
-    def _ai_analyze(self, alert_data: dict[str, Any], history: list[dict]) -> dict[str, Any] | None:
+        Returns:
+            Per alert, in order: analysis dict, or None if AI analysis failed
         """
-        Perform AI-powered analysis using LangChain.
+        if self.analysis_cache_ttl <= 0:
+            return self._ai_analyze_batch(contexts)
+
+        results: list[dict[str, Any] | None] = [None] * len(contexts)
+        keys = [self._analysis_cache_key(alert_data) for alert_data, _ in contexts]
+        now = time.monotonic()
+
+        misses = []
+        for i, key in enumerate(keys):
+            entry = self._analysis_cache.get(key)
+            if entry is not None and entry[0] > now:
+                results[i] = dict(entry[1])
+            else:
+                misses.append(i)
+
+        if misses:
+            # One MGET for every local miss; another analyzer may already have the answer
+            try:
+                values = self.redis.mget(
+                    [f"{self._STATE_PREFIX}analysis_cache:{keys[i]}" for i in misses]
+                )
+            except redis.RedisError as e:
+                self.logger.warning(f"Failed to read analysis cache: {e}")
+                values = [None] * len(misses)
+            for i, value in zip(misses, values, strict=True):
+                if value is None:
+                    continue
+                try:
+                    analysis = decode_payload(value)
+                except ValueError:
+                    continue
+                self._remember_analysis(keys[i], analysis, now)
+                results[i] = dict(analysis)
+
+        for i, analysis in enumerate(results):
+            if analysis is not None:
+                self.logger.info(
+                    f"Using cached AI analysis for {contexts[i][0].get('container_name', 'unknown')}: "
+                    f"action={analysis.get('action')} (cached=True)"
+                )
+
+        # Alerts that look the same share one LLM call
+        uncached: dict[str, list[int]] = {}
+        for i, key in enumerate(keys):
+            if results[i] is None:
+                uncached.setdefault(key, []).append(i)
+        if not uncached:
+            return results
+
+        fresh = self._ai_analyze_batch([contexts[indices[0]] for indices in uncached.values()])
+        for (key, indices), analysis in zip(uncached.items(), fresh, strict=True):
+            if analysis is None:
+                continue
+            for i in indices:
+                results[i] = dict(analysis)
+            # Only conservative outcomes are reused; scale_up/cleanup are always re-analyzed
+            if analysis.get("action") in _CACHEABLE_ACTIONS:
+                self._remember_analysis(key, analysis, now)
+                self.set_shared_state(
+                    f"analysis_cache:{key}", analysis, ttl=self.analysis_cache_ttl
+                )
+
+        return results
+
+    def _remember_analysis(self, key: str, analysis: dict[str, Any], now: float) -> None:
+        """
+        Store an analysis in the process-local cache, evicting the least recently added.
 
         Args:
-            alert_data: Current health alert data
-            history: List of historical alerts for pattern detection
+            key: Cache key from _analysis_cache_key()
+            analysis: AI analysis result to reuse
+            now: Current time.monotonic() value
+        """
+        cache = self._analysis_cache
+        cache[key] = (now + self.analysis_cache_ttl, analysis)
+        cache.move_to_end(key)
+        while len(cache) > _ANALYSIS_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _analysis_cache_key(alert_data: dict[str, Any]) -> str:
+        """
+        Build the answer-cache key for an alert.
+
+        Alerts for the same container whose status, exit code, restart count (capped just
+        past the restart-storm rule), CPU and memory (in 10% buckets) and anomaly types
+        match are treated as the same question.
+
+        Args:
+            alert_data: Health alert data from Monitor Agent
 
         Returns:
-            Analysis dict with keys: action, reason, confidence, is_false_alarm, analysis_method
-            Returns None if AI analysis fails (triggers fallback)
+            16-character hex digest
         """
-        try:
-            from langchain_core.messages import HumanMessage, SystemMessage
+        metrics = alert_data.get("metrics", {})
+        cpu = metrics.get("cpu_percent")
+        memory = metrics.get("memory_percent")
+        anomaly_types = sorted({a.get("type", "unknown") for a in alert_data.get("anomalies", [])})
+        key_input = "|".join(
+            (
+                str(alert_data.get("container_name", "unknown")),
+                str(alert_data.get("health_status", "unknown")),
+                str(alert_data.get("exit_code", 0)),
+                str(min(alert_data.get("restart_count", 0) or 0, 6)),
+                str(int(cpu // 10)) if isinstance(cpu, int | float) else "-",
+                str(int(memory // 10)) if isinstance(memory, int | float) else "-",
+                ",".join(anomaly_types),
+            )
+        )
+        return hashlib.blake2b(key_input.encode(), digest_size=8).hexdigest()
 
-            container_name = alert_data.get("container_name", "unknown")
-            metrics = alert_data.get("metrics", {})
-            anomalies = alert_data.get("anomalies", [])
-            health_status = alert_data.get("health_status", "unknown")
-
-            # Build context for the prompt
-            history_summary = ""
-            if history:
-                history_summary = f"\n\nRecent alert history ({len(history)} alerts):\n"
-                for i, h in enumerate(history[-3:], 1):  # Last 3 alerts
-                    h_metrics = h.get("metrics", {})
-                    h_anomalies = h.get("anomalies", [])
-                    history_summary += f"  Alert {i}: CPU={h_metrics.get('cpu_percent', 'N/A')}%, Memory={h_metrics.get('memory_percent', 'N/A')}%, Anomalies={len(h_anomalies)}\n"
-
-            # Build structured prompt
-            prompt_text = f"""You are an expert DevOps engineer analyzing container health issues.
-
-Container: {container_name}
-Health Status: {health_status}
+    def _ai_analyze_batch(
+        self, contexts: list[tuple[dict[str, Any], list[dict]]]
+    ) -> list[dict[str, Any] | None]:
+        """
+        Perform AI-powered analysis of several alerts using LangChain.
 
-Current Metrics:
-- CPU: {metrics.get("cpu_percent", "N/A")}%
-- Memory: {metrics.get("memory_percent", "N/A")}%
-- Network I/O: {metrics.get("network_io", "N/A")}
-- Disk I/O: {metrics.get("disk_io", "N/A")}
-- Exit Code: {alert_data.get("exit_code", "N/A")}
-- Restart Count: {alert_data.get("restart_count", 0)}
+        Prompts go through the LLM's batch API, which keeps up to ANALYZER_AI_CONCURRENCY
+        calls in flight at once. Alerts whose call fails or returns an unusable response
+        are retried together, up to _AI_MAX_RETRIES attempts.
 
-Detected Anomalies ({len(anomalies)}):
-{json.dumps(anomalies, indent=2) if anomalies else "None"}
-{history_summary}
+        Args:
+            contexts: (alert_data, history) pairs, where history lists earlier alerts for
+                the alert's container
 
-Respond with valid JSON only, no code fences or commentary. Provide your analysis in this format:
-{{
-  "root_cause": "Brief description of the root cause",
-  "action": "restart|scale_up|cleanup|none",
-  "reason": "Explanation for the recommended action",
-  "confidence": 0.0-1.0,
-  "is_false_alarm": true|false
-}}
+        Returns:
+            Per alert, in order: analysis dict with keys root_cause, action, reason,
+            confidence, is_false_alarm, analysis_method; or None if AI analysis failed
+            (triggers fallback)
+        """
+        results: list[dict[str, Any] | None] = [None] * len(contexts)
 
-Be concise and focus on actionable insights."""
+        try:
+            if not self.chain:
+                self.logger.error("LLM not initialized")
+                return results
 
-            # Invoke LLM with retry logic
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    messages = [
-                        SystemMessage(
-                            content="You are an expert DevOps engineer analyzing container health issues."
-                        ),
-                        HumanMessage(content=prompt_text),
-                    ]
-
-                    if not self.llm:
-                        self.logger.error("LLM not initialized")
-                        return None
-
-                    response = self.llm.invoke(messages)
-                    # HuggingFaceEndpoint returns str directly, Chat models return object with .content
-                    response_text = response.content if hasattr(response, 'content') else str(response)
-
-                    # Parse JSON response - strip code fences first
-                    json_str = response_text.strip()
-                    # Remove markdown code fences if present
-                    json_str = re.sub(r"^```(?:json)?\s*", "", json_str)
-                    json_str = re.sub(r"\s*```$", "", json_str)
-
-                    # Try to extract first complete JSON object from response
-                    json_start = json_str.find("{")
-                    if json_start >= 0:
-                        # Find matching closing brace by counting braces
-                        brace_count = 0
-                        json_end = json_start
-                        for i in range(json_start, len(json_str)):
-                            if json_str[i] == '{':
-                                brace_count += 1
-                            elif json_str[i] == '}':
-                                brace_count -= 1
-                                if brace_count == 0:
-                                    json_end = i + 1
-                                    break
-                        
-                        if json_end > json_start:
-                            json_str = json_str[json_start:json_end]
-
-                    # Parse JSON
-                    analysis_result = json.loads(json_str)
-
-                    # Validate required fields
-                    if all(
-                        k in analysis_result
-                        for k in [
-                            "root_cause",
-                            "action",
-                            "reason",
-                            "confidence",
-                            "is_false_alarm",
-                        ]
-                    ):
-                        analysis_result["analysis_method"] = "ai"
-                        self.logger.info(
-                            f"AI analysis successful for {container_name}: "
-                            f"action={analysis_result['action']}, confidence={analysis_result['confidence']}"
-                        )
-                        return analysis_result
+            inputs = [
+                self._build_prompt_inputs(alert_data, history) for alert_data, history in contexts
+            ]
 
-                    self.logger.warning(
-                        f"Invalid AI response format for {container_name}, retrying..."
-                    )
+            # Invoke LLM with retry logic
+            pending = list(range(len(contexts)))
+            for attempt in range(_AI_MAX_RETRIES):
+                responses = self.chain.batch(
+                    [inputs[i] for i in pending],
+                    config={"max_concurrency": self.ai_concurrency},
+                    return_exceptions=True,
+                )
 
-                except json.JSONDecodeError as e:
-                    self.logger.warning(
-                        f"Failed to parse AI response (attempt {attempt + 1}/{max_retries}): {e}"
-                    )
-                    if attempt < max_retries - 1:
-                        # Sleep between retries for non-JSON formats
-                        time.sleep(0.5 * (2**attempt))
-                    continue
-                except Exception as e:
-                    # Handle TGI server errors and other exceptions
-                    error_msg = str(e)
-                    if "Value out of range" in error_msg or "424" in error_msg:
+                retry = []
+                for i, response in zip(pending, responses, strict=True):
+                    container_name = contexts[i][0].get("container_name", "unknown")
+
+                    if isinstance(response, Exception):
+                        # Handle TGI server errors and other exceptions
+                        error_msg = str(response)
+                        if "Value out of range" in error_msg or "424" in error_msg:
+                            self.logger.error(
+                                f"TGI server error for {container_name}: {error_msg}. "
+                                "This may indicate the model encountered an internal error. Falling back to rule-based analysis."
+                            )
+                            continue  # Don't retry on server errors, fall back immediately
                         self.logger.error(
-                            f"TGI server error for {container_name}: {error_msg}. "
-                            "This may indicate the model encountered an internal error. Falling back to rule-based analysis."
+                            f"AI analysis error for {container_name}: {response}",
+                            exc_info=response if attempt == _AI_MAX_RETRIES - 1 else False,
                         )
-                        break  # Don't retry on server errors, fall back immediately
-                    else:
-                        self.logger.error(
-                            f"AI analysis error for {container_name}: {e}",
-                            exc_info=True if attempt == max_retries - 1 else False
-                        )
-                    if attempt < max_retries - 1:
-                        time.sleep(0.5 * (2**attempt))
-                    continue
+                        retry.append(i)
+                        continue
 
-            self.logger.warning(
-                f"AI analysis failed for {container_name} after {max_retries} attempts; falling back to rule-based"
-            )
-            return None
+                    analysis_result = self._parse_ai_response(response, container_name, attempt)
+                    if analysis_result is None:
+                        retry.append(i)
+                    else:
+                        results[i] = analysis_result
+
+                pending = retry
+                if not pending:
+                    break
+                # Back off with full jitter so analyzers that failed together do not retry
+                # in lockstep; give up at once if the agent is stopping
+                backoff = random.uniform(0, 0.5 * (2**attempt))
+                if attempt < _AI_MAX_RETRIES - 1 and self.wait_for_stop(backoff):
+                    break
+
+            for i in pending:
+                self.logger.warning(
+                    f"AI analysis failed for {contexts[i][0].get('container_name', 'unknown')}; "
+                    "falling back to rule-based"
+                )
 
         except Exception as e:
-            self.logger.error(
-                f"AI analysis error for {alert_data.get('container_name', 'unknown')}: {e}",
-                exc_info=True,
+            self.logger.error(f"AI analysis error: {e}", exc_info=True)
+
+        return results
+
+    def _build_prompt_inputs(
+        self, alert_data: dict[str, Any], history: list[dict]
+    ) -> dict[str, Any]:
+        """
+        Build the per-alert values for the analysis prompt template.
+
+        Args:
+            alert_data: Current health alert data
+            history: List of historical alerts for pattern detection
+
+        Returns:
+            Dict of _ALERT_PROMPT placeholder values
+        """
+        metrics = alert_data.get("metrics", {})
+        anomalies = alert_data.get("anomalies", [])
+
+        # Build context for the prompt
+        history_summary = ""
+        if history:
+            history_summary = f"\nRecent alert history ({len(history)} alerts):\n"
+            for i, h in enumerate(history[-3:], 1):  # Last 3 alerts
+                h_metrics = h.get("metrics", {})
+                h_anomalies = h.get("anomalies", [])
+                history_summary += f"  Alert {i}: CPU={h_metrics.get('cpu_percent', 'N/A')}%, Memory={h_metrics.get('memory_percent', 'N/A')}%, Anomalies={len(h_anomalies)}\n"
+
+        return {
+            "container_name": alert_data.get("container_name", "unknown"),
+            "health_status": alert_data.get("health_status", "unknown"),
+            "cpu_percent": metrics.get("cpu_percent", "N/A"),
+            "memory_percent": metrics.get("memory_percent", "N/A"),
+            "network_io": metrics.get("network_io", "N/A"),
+            "disk_io": metrics.get("disk_io", "N/A"),
+            "exit_code": alert_data.get("exit_code", "N/A"),
+            "restart_count": alert_data.get("restart_count", 0),
+            "anomaly_count": len(anomalies),
+            # Compact JSON: pretty-printing only adds prompt tokens
+            "anomalies": (
+                orjson.dumps(self._summarize_anomalies(anomalies)).decode() if anomalies else "None"
+            ),
+            "history_summary": history_summary,
+        }
+
+    @staticmethod
+    def _summarize_anomalies(
+        anomalies: list[dict[str, Any]], limit: int = _PROMPT_MAX_ANOMALY_GROUPS
+    ) -> list[dict[str, Any]]:
+        """
+        Collapse anomalies into one entry per (type, severity) for the LLM prompt.
+
+        Each entry is the first anomaly of its group, with a count added when the group
+        has more than one. Only the most severe groups are kept, so a noisy container
+        does not inflate the prompt.
+
+        Args:
+            anomalies: Anomalies reported by the Monitor Agent
+            limit: Maximum number of groups to return
+
+        Returns:
+            Anomaly groups ordered by severity (critical first), then first occurrence
+        """
+        groups: dict[tuple[Any, Any], dict[str, Any]] = {}
+        counts: dict[tuple[Any, Any], int] = {}
+        for anomaly in anomalies:
+            group = (anomaly.get("type"), anomaly.get("severity"))
+            if group in groups:
+                counts[group] += 1
+            else:
+                groups[group] = anomaly
+                counts[group] = 1
+
+        ordered = sorted(groups, key=lambda g: _SEVERITY_RANK.get(g[1], len(_SEVERITY_RANK)))
+        return [
+            groups[g] if counts[g] == 1 else {**groups[g], "count": counts[g]}
+            for g in ordered[:limit]
+        ]
+
+    def _parse_ai_response(
+        self, response: Any, container_name: str, attempt: int
+    ) -> dict[str, Any] | None:
+        """
+        Extract and validate the JSON analysis from an LLM response.
+
+        Args:
+            response: LLM response (dict from structured output, str from endpoints)
+            container_name: Container the alert is for, for logging
+            attempt: Zero-based attempt number, for logging
+
+        Returns:
+            Analysis dict with analysis_method set to "ai", or None if the response is
+            not valid JSON or lacks required fields
+        """
+        if isinstance(response, dict):
+            # Structured output: the provider already returned the fields
+            analysis_result = response
+        else:
+            # Parse JSON response - strip code fences first
+            json_str = str(response).strip()
+            # Remove markdown code fences if present
+            json_str = _FENCE_HEAD.sub("", json_str)
+            json_str = _FENCE_TAIL.sub("", json_str)
+
+            # Parse with orjson when the response is bare JSON; otherwise take the first
+            # complete JSON object, ignoring surrounding commentary. raw_decode stops at
+            # the object's end and handles braces inside strings. orjson.JSONDecodeError
+            # subclasses json.JSONDecodeError.
+            try:
+                try:
+                    analysis_result = orjson.loads(json_str)
+                except orjson.JSONDecodeError:
+                    json_start = json_str.find("{")
+                    if json_start < 0:
+                        raise
+                    analysis_result, _ = _JSON_DECODER.raw_decode(json_str, json_start)
+            except json.JSONDecodeError as e:
+                self.logger.warning(
+                    f"Failed to parse AI response for {container_name} "
+                    f"(attempt {attempt + 1}/{_AI_MAX_RETRIES}): {e}"
+                )
+                return None
+
+        # Validate required fields and their types in one pass (a quoted "false" or a
+        # string confidence would otherwise be misrouted or break logging downstream)
+        if (
+            isinstance(analysis_result, dict)
+            and all(isinstance(analysis_result.get(k), t) for k, t in _AI_RESULT_TYPES.items())
+            and not isinstance(analysis_result["confidence"], bool)
+        ):
+            analysis_result["analysis_method"] = "ai"
+            self.logger.info(
+                f"AI analysis successful for {container_name}: "
+                f"action={analysis_result['action']}, confidence={analysis_result['confidence']}"
             )
-            return None
+            return analysis_result
+
+        self.logger.warning(f"Invalid AI response format for {container_name}, retrying...")
+        return None
 
     def _rule_based_analyze(
         self, alert_data: dict[str, Any], history: list[dict]
@@ -428,12 +923,21 @@ Be concise and focus on actionable insights."""
                 "analysis_method": "rule_based",
             }
 
+        # Tally anomaly severities in a single pass for rules 3 and 7
+        critical_types = []
+        medium_count = 0
+        for anomaly in anomalies:
+            severity = anomaly.get("severity")
+            if severity == "critical":
+                critical_types.append(anomaly.get("type", "unknown"))
+            elif severity == "medium":
+                medium_count += 1
+
         # Rule 3: Critical severity anomaly
-        critical_anomalies = [a for a in anomalies if a.get("severity") == "critical"]
-        if critical_anomalies:
+        if critical_types:
             return {
                 "action": "restart",
-                "reason": f"Critical anomalies detected: {', '.join(a.get('type', 'unknown') for a in critical_anomalies)}",
+                "reason": f"Critical anomalies detected: {', '.join(critical_types)}",
                 "confidence": 0.85,
                 "is_false_alarm": False,
                 "analysis_method": "rule_based",
@@ -449,8 +953,11 @@ Be concise and focus on actionable insights."""
                 "analysis_method": "rule_based",
             }
 
+        # Extract CPU and memory series together, then classify each
+        cpu_values, memory_values = self._extract_trend_columns(history)
+
         # Rule 5: Sustained high CPU (2+ consecutive alerts)
-        cpu_trend = self._detect_metric_trend(history, "cpu_percent")
+        cpu_trend = self._classify_trend(cpu_values)
         if cpu_percent > 90 and cpu_trend in ["increasing", "stable"]:
             return {
                 "action": "restart",
@@ -461,7 +968,7 @@ Be concise and focus on actionable insights."""
             }
 
         # Rule 6: Memory leak pattern (increasing trend)
-        memory_trend = self._detect_metric_trend(history, "memory_percent")
+        memory_trend = self._classify_trend(memory_values)
         if memory_trend == "increasing" and memory_percent > 70:
             return {
                 "action": "restart",
@@ -472,8 +979,7 @@ Be concise and focus on actionable insights."""
             }
 
         # Rule 7: Transient spike (single medium anomaly, no history)
-        medium_anomalies = [a for a in anomalies if a.get("severity") == "medium"]
-        if len(anomalies) == 1 and len(medium_anomalies) == 1 and not history:
+        if len(anomalies) == 1 and medium_count == 1 and not history:
             return {
                 "action": "none",
                 "reason": "Transient spike detected; likely false alarm",
@@ -491,35 +997,52 @@ Be concise and focus on actionable insights."""
             "analysis_method": "rule_based",
         }
 
-    def _detect_metric_trend(self, history: list[dict], metric_key: str) -> str:
+    def _extract_trend_columns(self, history: list[dict]) -> tuple[list[float], list[float]]:
         """
-        Helper method to detect trends in historical metrics.
+        Collect CPU and memory values from the last 5 historical alerts in one pass.
 
         Args:
-            history: List of historical alert dicts
-            metric_key: Metric key to analyze (e.g., "cpu_percent", "memory_percent")
+            history: List of historical alert dicts, oldest first
 
         Returns:
-            Trend string: "increasing", "decreasing", "stable", or "unknown"
+            (cpu_values, memory_values), oldest first; alerts missing a metric are
+            skipped for that metric only
         """
-        try:
-            if len(history) < 2:
-                return "unknown"
+        cpu_values: list[float] = []
+        memory_values: list[float] = []
+        if len(history) < 2:
+            return cpu_values, memory_values
 
-            # Extract metric values from last 3-5 alerts
-            values = []
+        try:
             for alert in history[-5:]:
                 metrics = alert.get("metrics", {})
-                value = metrics.get(metric_key)
-                if value is not None:
-                    values.append(float(value))
+                cpu = metrics.get("cpu_percent")
+                if cpu is not None:
+                    cpu_values.append(float(cpu))
+                memory = metrics.get("memory_percent")
+                if memory is not None:
+                    memory_values.append(float(memory))
+        except (AttributeError, TypeError, ValueError) as e:
+            self.logger.debug(f"Error extracting metric history: {e}")
+            return [], []
+        return cpu_values, memory_values
+
+    def _classify_trend(self, values: list[float]) -> str:
+        """
+        Helper method to classify the trend of a metric series.
 
+        Args:
+            values: Metric values, oldest first (see _extract_trend_columns)
+
+        Returns:
+            Trend string: "increasing", "decreasing", "stable", or "unknown"
+        """
+        try:
             if len(values) < 2:
                 return "unknown"
 
-            # Calculate trend
-            diffs = [values[i + 1] - values[i] for i in range(len(values) - 1)]
-            avg_diff = sum(diffs) / len(diffs)
+            # Mean of adjacent differences telescopes to (last - first) / (n - 1)
+            avg_diff = (values[-1] - values[0]) / (len(values) - 1)
 
             if avg_diff > 5:  # Threshold for "increasing"
                 return "increasing"
@@ -532,15 +1055,18 @@ Be concise and focus on actionable insights."""
             self.logger.debug(f"Error detecting metric trend: {e}")
             return "unknown"
 
-    def _publish_remediation_needed(
+    def _remediation_needed_event(
         self, alert_data: dict[str, Any], analysis: dict[str, Any]
-    ) -> None:
+    ) -> tuple[str, str, dict[str, Any]]:
         """
-        Publish a remediation needed event.
+        Build a remediation needed event.
 
         Args:
             alert_data: Original health alert data
             analysis: Analysis result from AI or rule-based logic
+
+        Returns:
+            (channel, event_type, payload) tuple for publish_events()
         """
         container_name = alert_data.get("container_name", "unknown")
 
@@ -553,21 +1079,26 @@ Be concise and focus on actionable insights."""
             "analysis_method": analysis.get("analysis_method", "unknown"),
         }
 
-        self.publish_event("hemostat:remediation_needed", "remediation_needed", payload)
-
         self.logger.warning(
             f"Remediation needed for {container_name}: "
             f"action={analysis.get('action')}, confidence={analysis.get('confidence'):.2f}",
             extra={"agent": self.agent_name},
         )
 
-    def _publish_false_alarm(self, alert_data: dict[str, Any], analysis: dict[str, Any]) -> None:
+        return "hemostat:remediation_needed", "remediation_needed", payload
+
+    def _false_alarm_event(
+        self, alert_data: dict[str, Any], analysis: dict[str, Any]
+    ) -> tuple[str, str, dict[str, Any]]:
         """
-        Publish a false alarm event.
+        Build a false alarm event.
 
         Args:
             alert_data: Original health alert data
             analysis: Analysis result from AI or rule-based logic
+
+        Returns:
+            (channel, event_type, payload) tuple for publish_events()
         """
         container_name = alert_data.get("container_name", "unknown")
 
@@ -578,39 +1109,87 @@ Be concise and focus on actionable insights."""
             "analysis_method": analysis.get("analysis_method", "unknown"),
         }
 
-        self.publish_event("hemostat:false_alarm", "false_alarm", payload)
-
         self.logger.info(
             f"False alarm for {container_name}: {analysis.get('reason')} "
             f"(confidence={analysis.get('confidence'):.2f})",
             extra={"agent": self.agent_name},
         )
 
-    def _update_alert_history(self, container_name: str, alert_data: dict[str, Any]) -> None:
+        return "hemostat:false_alarm", "false_alarm", payload
+
+    def _history_key(self, container_name: str) -> str:
         """
-        Update alert history in Redis for pattern detection.
+        Return the Redis list key holding a container's recent alerts, oldest first.
 
         Args:
             container_name: Name of the container
-            alert_data: Current alert data to append to history
+
+        Returns:
+            Full Redis key for the container's alert history
         """
-        try:
-            # Retrieve existing history
-            history_key = f"alert_history:{container_name}"
-            existing = self.get_shared_state(history_key)
-            alerts = existing.get("alerts", []) if existing else []
+        return f"{self._STATE_PREFIX}alert_history:{container_name}"
 
-            # Append current alert
-            alerts.append(alert_data)
+    def _get_alert_histories(self, container_names: set[str]) -> dict[str, list[dict]]:
+        """
+        Fetch recent alert history for several containers in one round trip.
+
+        Args:
+            container_names: Containers to fetch history for
 
-            # Keep only last N alerts
-            alerts = alerts[-self.history_size :]
+        Returns:
+            Dict mapping each container name to its alerts, oldest first (empty if none
+            are stored or the fetch failed)
+        """
+        names = list(container_names)
+        histories: dict[str, list[dict]] = {name: [] for name in names}
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for name in names:
+                pipe.lrange(self._history_key(name), -self.history_size, -1)
+            # Per-key errors (e.g. a history left in the old single-value format) come
+            # back as exceptions and are treated as empty history
+            results = pipe.execute(raise_on_error=False)
+        except redis.RedisError as e:
+            self.logger.error(f"Error fetching alert history: {e}")
+            return histories
+
+        for name, entries in zip(names, results, strict=True):
+            if isinstance(entries, Exception):
+                continue
+            for entry in entries:
+                try:
+                    histories[name].append(decode_payload(entry))
+                except ValueError as e:
+                    self.logger.warning(f"Skipping malformed alert history entry for {name}: {e}")
+        return histories
 
-            # Store updated history
-            history_data = {"alerts": alerts, "container": container_name}
-            self.set_shared_state(history_key, history_data, ttl=self.history_ttl)
+    def _update_alert_history(self, container_name: str, alert_data: dict[str, Any]) -> None:
+        """
+        Update alert history in Redis for pattern detection.
 
-            self.logger.debug(f"Updated alert history for {container_name} ({len(alerts)} alerts)")
+        Args:
+            container_name: Name of the container
+            alert_data: Current alert data to append to history
+        """
+        history_key = self._history_key(container_name)
+        try:
+            entry = encode_payload(alert_data)
+            for attempt in range(2):
+                # Append, trim to the last N alerts and refresh the TTL in one round trip
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.rpush(history_key, entry)
+                pipe.ltrim(history_key, -self.history_size, -1)
+                pipe.expire(history_key, self.history_ttl)
+                try:
+                    pipe.execute()
+                    break
+                except redis.ResponseError as e:
+                    # History written in the old single-value format; replace it
+                    if attempt or "WRONGTYPE" not in str(e):
+                        raise
+                    self.redis.delete(history_key)
+
+            self.logger.debug(f"Updated alert history for {container_name}")
 
         except Exception as e:
             self.logger.error(f"Error updating alert history for {container_name}: {e}")
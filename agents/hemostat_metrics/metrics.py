@@ -170,7 +170,8 @@ class MetricsExporter(HemoStatAgent):
 
         Starts HTTP server for Prometheus scraping and subscribes to HemoStat events.
         """
-        self._running = True
+        self.running = True
+        self._stop_event.clear()
 
         # Start Prometheus HTTP server
         try:
@@ -193,7 +194,7 @@ class MetricsExporter(HemoStatAgent):
         start_time = time.time()
 
         try:
-            while self._running:
+            while self.running:
                 # Update uptime metric
                 uptime = time.time() - start_time
                 self.agent_uptime_seconds.labels(agent_name="metrics").set(uptime)
@@ -204,7 +205,7 @@ class MetricsExporter(HemoStatAgent):
                     # Message already handled by registered callback
                     pass
 
-                time.sleep(0.1)
+                self.wait_for_stop(0.1)
         except KeyboardInterrupt:
             self.logger.info("Metrics exporter interrupted by user")
         finally:
@@ -335,5 +336,6 @@ class MetricsExporter(HemoStatAgent):
 
     def stop(self) -> None:
         """Stop the metrics exporter agent gracefully."""
-        self._running = False
+        self.running = False
+        self._stop_event.set()
         self.logger.info("Metrics exporter stopped")
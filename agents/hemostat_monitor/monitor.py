@@ -7,16 +7,73 @@ Publishes structured health alerts to Redis for consumption by the Analyzer Agen
 
 import fnmatch
 import os
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime, UTC
 from typing import Any
 
 import docker
-from docker.errors import APIError, DockerException
+import requests
+from docker.errors import APIError, DockerException, NotFound
 
 from agents.agent_base import HemoStatAgent
 from agents.platform_utils import get_docker_host
 
+# Container state transitions that trigger an immediate health check between polls
+_WATCHED_EVENTS = ["die", "oom", "health_status", "restart"]
+
+# Longest wait before reconnecting to the Docker event stream after an error
+_EVENTS_MAX_BACKOFF = 30.0
+
+# Longest wait between polls while Docker keeps failing
+_POLL_MAX_BACKOFF = 300.0
+
+# cgroup v2 hierarchy and the container scope locations used by the systemd and
+# cgroupfs cgroup drivers (see _find_cgroup_path())
+_CGROUP_ROOT = "/sys/fs/cgroup"
+_CGROUP_SCOPES = ("system.slice/docker-{id}.scope", "docker/{id}")
+
+
+@dataclass(frozen=True, slots=True)
+class ContainerSnapshot:
+    """
+    Container details read once per health check.
+
+    Built from a single inspect response so the check never goes back to the Docker
+    API for metadata (docker-py's ``Container.image``, for one, fetches the image).
+    """
+
+    id: str
+    short_id: str
+    name: str
+    status: str
+    image: str
+    attrs: dict[str, Any]
+
+    @classmethod
+    def from_container(cls, container) -> "ContainerSnapshot":
+        """
+        Capture an inspected Docker container.
+
+        Args:
+            container: Docker container object with full (non-sparse) attrs
+
+        Returns:
+            ContainerSnapshot of the container's current attrs
+        """
+        attrs = container.attrs
+        return cls(
+            id=attrs["Id"],
+            short_id=attrs["Id"][:12],
+            name=attrs.get("Name", "").lstrip("/"),
+            status=attrs.get("State", {}).get("Status", "unknown"),
+            image=attrs.get("Config", {}).get("Image") or "unknown",
+            attrs=attrs,
+        )
+
 
 class ContainerMonitor(HemoStatAgent):
     """
@@ -37,10 +94,19 @@ class ContainerMonitor(HemoStatAgent):
         # Initialize base agent
         super().__init__(agent_name="monitor")
 
+        # Containers are checked concurrently by up to this many threads per poll
+        self.poll_workers = int(os.getenv("MONITOR_POLL_WORKERS", 10))
+
+        # Seconds before a Docker API call is abandoned (the event stream is not limited)
+        self.docker_timeout = int(os.getenv("MONITOR_DOCKER_TIMEOUT", 10))
+
         # Initialize Docker client with platform-aware socket detection
         try:
             docker_host = os.getenv("DOCKER_HOST") or get_docker_host()
-            self.docker_client = docker.from_env()
+            # One pooled daemon connection per poll worker, so a poll never waits on the pool
+            self.docker_client = docker.from_env(
+                max_pool_size=self.poll_workers, timeout=self.docker_timeout
+            )
             self.logger.info(f"Docker client initialized successfully: {docker_host}")
             self.docker_available = True
         except DockerException as e:
@@ -61,6 +127,33 @@ class ContainerMonitor(HemoStatAgent):
         # Patterns support wildcards: hemostat-* will match hemostat-monitor, hemostat-analyzer, etc.
         blacklist_str = os.getenv("MONITOR_CONTAINER_BLACKLIST", "hemostat-*").strip()
         self.blacklist = [p.strip() for p in blacklist_str.split(",") if p.strip()]
+
+        # Container ID -> (total CPU usage, system CPU usage) from the previous poll, used
+        # to compute CPU percent from one-shot stats (which carry no precpu_stats)
+        self._prev_cpu: dict[str, tuple[int, int]] = {}
+
+        # Read CPU/memory/IO straight from the host's cgroup v2 files instead of the stats
+        # API (Linux only; needs the host's /sys/fs/cgroup and PID namespace)
+        self.use_cgroup_stats = os.getenv("MONITOR_CGROUP_STATS", "false").lower() == "true"
+        if self.use_cgroup_stats and not os.path.exists(f"{_CGROUP_ROOT}/cgroup.controllers"):
+            self.logger.warning(
+                f"MONITOR_CGROUP_STATS is set but {_CGROUP_ROOT} is not a cgroup v2 "
+                f"hierarchy; using the Docker stats API"
+            )
+            self.use_cgroup_stats = False
+
+        # Container ID -> cgroup directory (None if it has none we can read), and
+        # container ID -> (CPU usage usec, monotonic ns) from the previous cgroup read
+        self._cgroup_paths: dict[str, str | None] = {}
+        self._prev_cgroup_cpu: dict[str, tuple[int, int]] = {}
+
+        self._poll_pool = ThreadPoolExecutor(
+            max_workers=self.poll_workers, thread_name_prefix="monitor-poll"
+        )
+
+        # Docker event stream reader; see _watch_events()
+        self._events_thread: threading.Thread | None = None
+        self._events_stream = None
         
         self.logger.info(
             f"Monitor Agent initialized with thresholds: "
@@ -73,59 +166,222 @@ class ContainerMonitor(HemoStatAgent):
         """
         Main monitoring loop that runs continuously until stopped.
 
-        Polls containers at regular intervals and detects anomalies.
+        Polls containers at regular intervals and detects anomalies. A background thread
+        also watches Docker events so exits, OOM kills, restarts and health status
+        changes are checked as they happen rather than on the next poll.
         """
-        self._running = True
+        self.running = True
+        self._stop_event.clear()
         self.logger.info("Starting monitor loop")
 
+        if self.docker_available:
+            self._events_thread = threading.Thread(
+                target=self._watch_events, name="monitor-events", daemon=True
+            )
+            self._events_thread.start()
+
         try:
-            while self._running:
+            failures = 0
+            while self.running:
                 try:
-                    self._poll_containers()
+                    ok = self._poll_containers()
                 except Exception as e:
                     self.logger.error(f"Error during container polling: {e}", exc_info=True)
-
-                time.sleep(self.poll_interval)
+                    ok = False
+
+                if ok:
+                    failures = 0
+                    delay = self.poll_interval
+                else:
+                    # Back off exponentially while Docker keeps failing; jitter keeps
+                    # monitors on different hosts from reconnecting in lockstep
+                    delay = min(self.poll_interval * 2**failures, _POLL_MAX_BACKOFF)
+                    delay += random.uniform(0, 1.0)
+                    failures += 1
+                    self.logger.warning(f"Container polling failed; next attempt in {delay:.1f}s")
+
+                self.wait_for_stop(delay)
         except KeyboardInterrupt:
             self.logger.info("Monitor interrupted by user")
         finally:
             self.stop()
 
-    def _poll_containers(self) -> None:
+    def _poll_containers(self) -> bool:
         """
         Fetch all containers (running and exited) and check their health status.
 
         Includes both running and exited containers to detect non-zero exit codes.
+        Containers are checked concurrently on the poll thread pool; checks still
+        unfinished after 80% of the poll interval are abandoned for this cycle.
         Handles Docker API errors gracefully without breaking the loop.
         Skips polling if Docker is unavailable.
+
+        Returns:
+            False if listing containers failed, True otherwise
         """
         if not self.docker_available:
-            return
+            return True
 
         try:
+            # Sparse listing is one API call; each container is inspected once by its worker
             containers = self.docker_client.containers.list(
-                all=True, filters={"status": ["running", "exited"]}
+                all=True, sparse=True, filters={"status": ["running", "exited"]}
             )
             self.logger.debug(f"Polling {len(containers)} containers")
 
+            # Forget CPU samples of containers that no longer exist
+            current_ids = {container.id for container in containers}
+            for cache in (self._prev_cpu, self._cgroup_paths, self._prev_cgroup_cpu):
+                for container_id in cache.keys() - current_ids:
+                    cache.pop(container_id, None)
+
+            # Every container checked in this cycle shares the poll's timestamp
+            timestamp = datetime.now(UTC).isoformat()
+            futures = {}
             for container in containers:
-                try:
-                    # Skip containers based on whitelist/blacklist
-                    if not self._should_monitor_container(container.name):
-                        self.logger.debug(f"Skipping filtered container: {container.name}")
-                        continue
-                    
-                    # Refresh container state to avoid stale status
-                    container.reload()
-                    self._check_container_health(container)
-                except Exception as e:
-                    self.logger.error(
-                        f"Error checking container {container.short_id}: {e}", exc_info=False
-                    )
+                # Sparse attrs carry "Names" (e.g. ["/web"]) rather than "Name"
+                names = container.attrs.get("Names") or [container.id[:12]]
+                container_name = names[0].lstrip("/")
+
+                # Skip containers based on whitelist/blacklist
+                if not self._should_monitor_container(container_name):
+                    self.logger.debug(f"Skipping filtered container: {container_name}")
+                    continue
+
+                future = self._poll_pool.submit(self._poll_container, container, timestamp)
+                futures[future] = container_name
+
+            # Bound the cycle so one slow container cannot delay the next poll
+            done, not_done = wait(futures, timeout=self.poll_interval * 0.8)
+            for future in not_done:
+                future.cancel()
+            if not_done:
+                self.logger.warning(
+                    f"Health checks timed out for {len(not_done)} containers: "
+                    f"{', '.join(futures[f] for f in not_done)}"
+                )
+
+            # Write the whole cycle's state and alerts to Redis together
+            state_writes: list[tuple[str, dict[str, Any], int]] = []
+            events: list[tuple[str, str, dict[str, Any]]] = []
+            for future in done:
+                container_writes, container_events = future.result()
+                state_writes.extend(container_writes)
+                events.extend(container_events)
+            self._flush_writes(state_writes, events)
+            return True
         except APIError as e:
             self.logger.error(f"Docker API error during container listing: {e}")
         except DockerException as e:
             self.logger.error(f"Docker error during polling: {e}")
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Docker daemon unreachable during polling: {e}")
+        return False
+
+    def _watch_events(self) -> None:
+        """
+        Check containers as soon as Docker reports a watched state transition.
+
+        Runs on the events thread until the monitor stops, reconnecting with
+        exponential backoff if the event stream fails. Checks run on the poll thread pool.
+        """
+        failures = 0
+        while self.running:
+            try:
+                self._events_stream = self.docker_client.events(
+                    decode=True, filters={"type": "container", "event": _WATCHED_EVENTS}
+                )
+                failures = 0
+                for event in self._events_stream:
+                    if not self.running:
+                        break
+                    # The legacy top-level "id"/"status" fields are gone from current API
+                    # versions; the container is identified by the event's Actor
+                    actor = event.get("Actor") or {}
+                    container_id = actor.get("ID")
+                    if not container_id:
+                        continue
+                    container_name = (actor.get("Attributes") or {}).get("name", "")
+                    if not self._should_monitor_container(container_name):
+                        continue
+                    self.logger.debug(
+                        f"Docker event '{event.get('Action')}' for {container_name}; checking now"
+                    )
+                    self._poll_pool.submit(self._check_container_event, container_id)
+            except (DockerException, requests.exceptions.RequestException) as e:
+                if not self.running:
+                    break
+                failures += 1
+                backoff = min(_EVENTS_MAX_BACKOFF, 2.0 ** (failures - 1))
+                self.logger.warning(
+                    f"Docker event stream failed: {e}; reconnecting in {backoff:.0f}s"
+                )
+                self.wait_for_stop(backoff)
+            except RuntimeError:
+                # Pool shut down by stop() while an event was being dispatched
+                break
+
+    def _check_container_event(self, container_id: str) -> None:
+        """
+        Check the health of a container named by a Docker event (runs on the poll thread pool).
+
+        Args:
+            container_id: ID of the container the event is about
+        """
+        try:
+            container = self.docker_client.containers.get(container_id)
+            self._flush_writes(
+                *self._check_container_health(
+                    ContainerSnapshot.from_container(container), datetime.now(UTC).isoformat()
+                )
+            )
+        except NotFound:
+            self.logger.debug(f"Container {container_id!s:.12} removed before it could be checked")
+        except Exception as e:
+            self.logger.error(f"Error checking container {container_id!s:.12}: {e}", exc_info=False)
+
+    def _poll_container(
+        self, container, timestamp: str
+    ) -> tuple[list[tuple[str, dict[str, Any], int]], list[tuple[str, str, dict[str, Any]]]]:
+        """
+        Inspect a container and check its health (runs on the poll thread pool).
+
+        Args:
+            container: Docker container object from a sparse listing
+            timestamp: ISO timestamp of the poll cycle
+
+        Returns:
+            Pending Redis writes, as returned by _check_container_health()
+        """
+        try:
+            # Inspect the container for its current state
+            container.reload()
+            return self._check_container_health(
+                ContainerSnapshot.from_container(container), timestamp
+            )
+        except NotFound:
+            self.logger.debug(f"Container {container.short_id} removed before it could be checked")
+            return [], []
+        except Exception as e:
+            self.logger.error(f"Error checking container {container.short_id}: {e}", exc_info=False)
+            return [], []
+
+    def _flush_writes(
+        self,
+        state_writes: list[tuple[str, dict[str, Any], int]],
+        events: list[tuple[str, str, dict[str, Any]]],
+    ) -> None:
+        """
+        Send pending container state writes and health alerts to Redis.
+
+        Each group goes out in one pipelined round trip.
+
+        Args:
+            state_writes: (key, value, ttl) shared state writes, applied in order
+            events: (channel, event_type, data) events to publish
+        """
+        self.set_shared_states(state_writes)
+        self.publish_events(events)
 
     def _should_monitor_container(self, container_name: str) -> bool:
         """
@@ -150,22 +406,32 @@ class ContainerMonitor(HemoStatAgent):
         
         return True
 
-    def _check_container_health(self, container) -> None:
+    def _check_container_health(
+        self, container: ContainerSnapshot, timestamp: str
+    ) -> tuple[list[tuple[str, dict[str, Any], int]], list[tuple[str, str, dict[str, Any]]]]:
         """
         Check the health status of a single container.
 
-        Collects metrics, detects anomalies, and publishes alerts if needed.
+        Collects metrics and detects anomalies. Redis writes are returned rather than
+        sent so callers can batch them (see _flush_writes()).
 
         Args:
-            container: Docker container object
+            container: Snapshot of the container to check
+            timestamp: ISO timestamp to record the container state under
+
+        Returns:
+            (state_writes, events): container state to store as (key, value, ttl) tuples,
+            and health alerts to publish as (channel, event_type, data) tuples
         """
         container_name = container.name
+        state_writes: list[tuple[str, dict[str, Any], int]] = []
+        events: list[tuple[str, str, dict[str, Any]]] = []
 
         try:
             # Collect container metadata
             stats = self._get_container_stats(container)
             if stats is None:
-                return
+                return state_writes, events
 
             # Get health status
             health_info = self._check_health_status(container)
@@ -185,41 +451,56 @@ class ContainerMonitor(HemoStatAgent):
                 "memory_usage": stats.get("memory_usage", 0),
                 "memory_limit": stats.get("memory_limit", 0),
                 "health_status": health_info["health_status"],
-                "timestamp": datetime.now(UTC).isoformat(),
+                "timestamp": timestamp,
             }
-            self.set_shared_state(f"container:{container_id}", container_state, ttl=300)
+            state_writes.append((f"container:{container_id}", container_state, 300))
 
             # Publish alert if anomalies detected
             if anomalies:
-                self._publish_health_alert(container, stats, anomalies, health_info)
+                event = self._health_alert_event(container, stats, anomalies, health_info)
+                if event is not None:
+                    events.append(event)
+                    # Shared state is replaced with the alert's metrics, as before
+                    state_writes.append((f"container:{container_id}", stats, 300))
             else:
                 self.logger.debug(f"Container {container_name} is healthy")
         except Exception as e:
             self.logger.error(f"Error checking health of {container_name}: {e}", exc_info=False)
 
-    def _get_container_stats(self, container) -> dict[str, Any] | None:
+        return state_writes, events
+
+    def _get_container_stats(self, container: ContainerSnapshot) -> dict[str, Any] | None:
         """
-        Fetch container metrics using non-streaming stats call.
+        Fetch container metrics using a one-shot, non-streaming stats call.
 
-        Uses precpu_stats and cpu_stats for CPU calculation without maintaining open streams.
-        This method retrieves a single snapshot of container statistics and calculates
-        CPU percentage using Docker's official formula with precpu_stats to avoid
-        connection leaks from streaming calls.
+        One-shot stats return immediately instead of making the daemon sample twice about
+        a second apart, and avoid the connection leaks of streaming calls. CPU percentage
+        is computed against the previous poll's sample for the container (see
+        _calculate_cpu_percent).
+
+        When MONITOR_CGROUP_STATS is enabled the cgroup files are tried first (see
+        _get_container_stats_cgroup), falling back to the API for containers without a
+        readable cgroup.
 
         Args:
-            container: Docker container object to fetch stats for
+            container: Snapshot of the container to fetch stats for
 
         Returns:
             Dictionary with keys: cpu_percent, memory_percent, memory_usage, memory_limit,
             network_rx_bytes, network_tx_bytes, blkio_read_bytes, blkio_write_bytes.
             Returns None if stats retrieval fails.
         """
+        if self.use_cgroup_stats:
+            metrics = self._get_container_stats_cgroup(container)
+            if metrics is not None:
+                return metrics
+
         try:
-            # Use non-streaming call to get stats with precpu_stats for CPU calculation
-            stats = container.stats(stream=False)
+            # One-shot call: a single snapshot without the daemon's ~1s precpu sampling
+            stats = self.docker_client.api.stats(container.id, stream=False, one_shot=True)
 
-            # Calculate CPU percentage using Docker's formula with precpu_stats
-            cpu_percent = self._calculate_cpu_percent(stats)
+            # Calculate CPU percentage using Docker's formula against the previous poll
+            cpu_percent = self._calculate_cpu_percent(container.id, stats)
 
             # Calculate memory percentage
             memory_stats = stats.get("memory_stats", {})
@@ -259,10 +540,140 @@ class ContainerMonitor(HemoStatAgent):
             self.logger.error(f"Error getting stats for {container.name}: {e}")
             return None
 
-    def _check_health_status(self, container) -> dict[str, Any]:
+    def _find_cgroup_path(self, container_id: str) -> str | None:
+        """
+        Locate a container's cgroup v2 directory, caching the result.
+
+        Args:
+            container_id: Full container ID
+
+        Returns:
+            Path of the container's cgroup directory, or None if it has none under
+            _CGROUP_ROOT (e.g. Docker Desktop, where containers run in a VM)
+        """
+        if container_id in self._cgroup_paths:
+            return self._cgroup_paths[container_id]
+
+        path = None
+        for scope in _CGROUP_SCOPES:
+            candidate = os.path.join(_CGROUP_ROOT, scope.format(id=container_id))
+            if os.path.isdir(candidate):
+                path = candidate
+                break
+        if path is None:
+            self.logger.debug(f"No cgroup found for {container_id[:12]}; using the stats API")
+        self._cgroup_paths[container_id] = path
+        return path
+
+    def _get_container_stats_cgroup(self, container: ContainerSnapshot) -> dict[str, Any] | None:
+        """
+        Read container metrics from the host's cgroup v2 and procfs files.
+
+        Avoids the daemon entirely: CPU comes from cpu.stat, memory from memory.current,
+        memory.max and memory.stat, block I/O from io.stat, and network counters from
+        /proc/<pid>/net/dev (which needs the host PID namespace). CPU percentage is
+        usage time over wall time since the container's previous read, on the same
+        scale as _calculate_cpu_percent; the first read returns 0.0.
+
+        Args:
+            container: Snapshot of the container to read metrics for
+
+        Returns:
+            Metrics dictionary as returned by _get_container_stats, or None if the
+            container is not running or its files cannot be read
+        """
+        if container.status != "running":
+            return None
+        path = self._find_cgroup_path(container.id)
+        if path is None:
+            return None
+
+        try:
+            with open(f"{path}/cpu.stat") as f:
+                cpu_stat = dict(line.split() for line in f)
+            with open(f"{path}/memory.current") as f:
+                memory_usage = int(f.read())
+            with open(f"{path}/memory.max") as f:
+                memory_max = f.read().strip()
+            with open(f"{path}/memory.stat") as f:
+                memory_stat = dict(line.split() for line in f)
+            with open(f"{path}/io.stat") as f:
+                io_stat = f.read().split()
+            with open(f"/proc/{container.attrs['State']['Pid']}/net/dev") as f:
+                net_dev = f.readlines()[2:]  # Skip the two header lines
+
+            # CPU: delta of usage_usec over wall time since the previous read
+            cpu_usage = int(cpu_stat["usage_usec"])
+            now = time.monotonic_ns()
+            previous = self._prev_cgroup_cpu.get(container.id)
+            self._prev_cgroup_cpu[container.id] = (cpu_usage, now)
+            cpu_percent = 0.0
+            if previous is not None and now > previous[1]:
+                usage_ns = (cpu_usage - previous[0]) * 1000
+                cpu_percent = max(0.0, usage_ns / (now - previous[1]) * 100.0)
+
+            # Memory: "max" means unlimited, which the stats API reports as host memory
+            if memory_max == "max":
+                memory_limit = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+            else:
+                memory_limit = int(memory_max)
+            memory_percent = self._calculate_memory_percent(
+                {
+                    "usage": memory_usage,
+                    "limit": memory_limit,
+                    "stats": {"inactive_file": int(memory_stat.get("inactive_file", 0))},
+                }
+            )
+
+            # Block I/O: io.stat has one "MAJ:MIN rbytes=N wbytes=N ..." line per device
+            blkio_read_bytes = 0
+            blkio_write_bytes = 0
+            for field in io_stat:
+                key, _, value = field.partition("=")
+                if key == "rbytes":
+                    blkio_read_bytes += int(value)
+                elif key == "wbytes":
+                    blkio_write_bytes += int(value)
+
+            # Network: "iface: rx_bytes ... (8 rx fields) tx_bytes ...", loopback excluded
+            network_rx_bytes = 0
+            network_tx_bytes = 0
+            for line in net_dev:
+                iface, _, counters = line.partition(":")
+                if iface.strip() == "lo":
+                    continue
+                fields = counters.split()
+                network_rx_bytes += int(fields[0])
+                network_tx_bytes += int(fields[8])
+
+            return {
+                "cpu_percent": cpu_percent,
+                "memory_percent": memory_percent,
+                "memory_usage": memory_usage,
+                "memory_limit": memory_limit,
+                "network_rx_bytes": network_rx_bytes,
+                "network_tx_bytes": network_tx_bytes,
+                "blkio_read_bytes": blkio_read_bytes,
+                "blkio_write_bytes": blkio_write_bytes,
+            }
+        except (OSError, KeyError, IndexError, ValueError) as e:
+            self.logger.debug(f"cgroup read failed for {container.name}: {e}")
+            if os.path.isdir(path):
+                # Files unreadable or not the host's (e.g. no host PID namespace); stop
+                # trying for this container
+                self._cgroup_paths[container.id] = None
+            else:
+                # Container stopped mid-read; look the cgroup up again if it restarts
+                self._cgroup_paths.pop(container.id, None)
+            return None
+
+    def _check_health_status(self, container: ContainerSnapshot) -> dict[str, Any]:
         """
         Extract health status, exit code, and restart count from container.
 
+        Args:
+            container: Snapshot of the container
+
         Returns:
             Dictionary with health_status, exit_code, and restart_count
         """
@@ -294,7 +705,7 @@ class ContainerMonitor(HemoStatAgent):
             }
 
     def _detect_anomalies(
-        self, container, stats: dict[str, Any], health_info: dict[str, Any]
+        self, container: ContainerSnapshot, stats: dict[str, Any], health_info: dict[str, Any]
     ) -> list[dict[str, Any]]:
         """
         Detect anomalies in container metrics against configured thresholds.
@@ -305,7 +716,7 @@ class ContainerMonitor(HemoStatAgent):
         - medium: metric > 80% of threshold
 
         Args:
-            container: Docker container object
+            container: Snapshot of the container
             stats: Container metrics dictionary
             health_info: Health status information
 
@@ -390,21 +801,25 @@ class ContainerMonitor(HemoStatAgent):
 
         return anomalies
 
-    def _publish_health_alert(
+    def _health_alert_event(
         self,
-        container,
+        container: ContainerSnapshot,
         stats: dict[str, Any],
         anomalies: list[dict[str, Any]],
         health_info: dict[str, Any],
-    ) -> None:
+    ) -> tuple[str, str, dict[str, Any]] | None:
         """
-        Publish a health alert to Redis for consumption by the Analyzer Agent.
+        Build a health alert for consumption by the Analyzer Agent.
 
         Args:
-            container: Docker container object
+            container: Snapshot of the container
             stats: Container metrics
             anomalies: List of detected anomalies
             health_info: Health status information
+
+        Returns:
+            (channel, event_type, payload) tuple for publish_events(), or None if the
+            alert could not be built
         """
         try:
             container_id = container.short_id
@@ -414,7 +829,7 @@ class ContainerMonitor(HemoStatAgent):
             payload = {
                 "container_id": container_id,
                 "container_name": container_name,
-                "image": container.image.tags[0] if container.image.tags else "unknown",
+                "image": container.image,
                 "status": container.status,
                 "metrics": stats,
                 "anomalies": anomalies,
@@ -423,46 +838,48 @@ class ContainerMonitor(HemoStatAgent):
                 "restart_count": health_info["restart_count"],
             }
 
-            # Publish event
-            self.publish_event("hemostat:health_alert", "container_unhealthy", payload)
-
-            # Update shared state with TTL
-            self.set_shared_state(f"container:{container_id}", stats, ttl=300)
-
             self.logger.warning(
-                f"Health alert published for {container_name}: {len(anomalies)} anomalies detected"
+                f"Health alert for {container_name}: {len(anomalies)} anomalies detected"
             )
+            return "hemostat:health_alert", "container_unhealthy", payload
         except Exception as e:
-            self.logger.error(f"Error publishing health alert: {e}", exc_info=False)
+            self.logger.error(f"Error building health alert: {e}", exc_info=False)
+            return None
 
-    def _calculate_cpu_percent(self, stats: dict[str, Any]) -> float:
+    def _calculate_cpu_percent(self, container_id: str, stats: dict[str, Any]) -> float:
         """
         Calculate CPU percentage using Docker's official formula.
 
         Formula: (delta_cpu / delta_system) x online_cpus x 100
 
-        Uses precpu_stats and cpu_stats from a single stats snapshot.
+        Deltas are taken between this snapshot's cpu_stats and the sample cached from the
+        container's previous poll, so the result averages CPU usage over the poll interval.
+        The first sample of a container only primes the cache and returns 0.0.
         Allows CPU percent > 100% on multi-core systems.
 
         Args:
-            stats: Container stats dictionary with cpu_stats and precpu_stats
+            container_id: Full container ID the sample is cached under
+            stats: Container stats dictionary with cpu_stats
 
         Returns:
-            CPU percentage as float (0.0 if calculation fails, can exceed 100% on multi-core)
+            CPU percentage as float (0.0 if calculation fails or on the first sample, can
+            exceed 100% on multi-core)
         """
         try:
-            # Extract current and previous CPU values
+            # Extract current CPU values and swap in the cache for the next poll
             cpu_stats = stats.get("cpu_stats", {})
-            precpu_stats = stats.get("precpu_stats", {})
 
             cpu_usage = cpu_stats.get("cpu_usage", {}).get("total_usage", 0)
-            precpu_usage = precpu_stats.get("cpu_usage", {}).get("total_usage", 0)
-
             system_usage = cpu_stats.get("system_cpu_usage", 0)
-            presystem_usage = precpu_stats.get("system_cpu_usage", 0)
 
             online_cpus = cpu_stats.get("online_cpus", 1)
 
+            previous = self._prev_cpu.get(container_id)
+            self._prev_cpu[container_id] = (cpu_usage, system_usage)
+            if previous is None:
+                return 0.0
+            precpu_usage, presystem_usage = previous
+
             # Calculate deltas
             cpu_delta = cpu_usage - precpu_usage
             system_delta = system_usage - presystem_usage
@@ -484,6 +901,9 @@ class ContainerMonitor(HemoStatAgent):
         """
         Calculate memory percentage, excluding cache (matches docker stats behavior).
 
+        Not capped at 100%: usage above the limit (e.g. from kernel cache accounting)
+        is reported as-is so it still registers as an anomaly.
+
         Args:
             mem_stats: Memory stats from container stats
 
@@ -494,9 +914,12 @@ class ContainerMonitor(HemoStatAgent):
             usage = mem_stats.get("usage", 0)
             limit = mem_stats.get("limit", 0)
 
-            # Subtract cache (handle both cgroup v1 and v2)
+            # Subtract cache (cgroup v2 reports inactive_file, v1 total_inactive_file)
             stats = mem_stats.get("stats", {})
-            cache = stats.get("inactive_file", 0) or stats.get("total_inactive_file", 0)
+            if "inactive_file" in stats:
+                cache = stats["inactive_file"]
+            else:
+                cache = stats.get("total_inactive_file", 0)
 
             actual_usage = usage - cache
 
@@ -504,14 +927,23 @@ class ContainerMonitor(HemoStatAgent):
             if limit == 0:
                 return 0.0
 
-            memory_percent = (actual_usage / limit) * 100.0
+            memory_percent = actual_usage * (100.0 / limit)
 
-            return max(0.0, min(memory_percent, 100.0))  # Clamp to 0-100
+            return max(0.0, memory_percent)
         except Exception as e:
             self.logger.debug(f"Error calculating memory percent: {e}")
             return 0.0
 
     def stop(self) -> None:
         """Stop the monitor agent gracefully."""
-        self._running = False
+        self.running = False
+        self._stop_event.set()
+        # Closing the event stream unblocks the events thread
+        if self._events_stream is not None:
+            try:
+                self._events_stream.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing Docker event stream: {e}")
+        # Drop queued checks; in-flight ones finish on their own
+        self._poll_pool.shutdown(wait=False, cancel_futures=True)
         self.logger.info("Monitor agent stopped")
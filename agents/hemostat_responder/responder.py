@@ -5,13 +5,13 @@ Executes remediation actions recommended by the Analyzer Agent with comprehensiv
 safety constraints including cooldown periods, circuit breakers, and audit logging.
 """
 
-import json
 import os
 import time
 from datetime import UTC, datetime
 from typing import Any
 
 import docker
+import orjson
 from docker.errors import APIError, DockerException, NotFound
 
 from agents.agent_base import HemoStatAgent
@@ -133,7 +133,7 @@ class ContainerResponder(HemoStatAgent):
         try:
             # Extract request payload from message wrapper
             request_data = message.get("data", {})
-            self.logger.info(f"Received remediation request: {json.dumps(request_data)}")
+            self.logger.info(f"Received remediation request: {orjson.dumps(request_data).decode()}")
             self._execute_remediation(request_data)
         except Exception as e:
             self.logger.error(f"Error handling remediation request: {e}", exc_info=True)
@@ -868,9 +868,10 @@ class ContainerResponder(HemoStatAgent):
                 "dry_run": dry_run,
             }
 
-            # Store in Redis list (LPUSH for newest first)
+            # Store in Redis list (LPUSH for newest first); plain JSON, as it is read
+            # directly with redis-cli
             audit_key = f"hemostat:audit:{container}"
-            self.redis.lpush(audit_key, json.dumps(audit_entry))
+            self.redis.lpush(audit_key, orjson.dumps(audit_entry, option=orjson.OPT_NON_STR_KEYS))
 
             # Keep only last 100 entries
             self.redis.ltrim(audit_key, 0, 99)
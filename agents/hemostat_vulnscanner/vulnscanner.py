@@ -366,13 +366,13 @@ class VulnerabilityScanner(HemoStatAgent):
         self.logger.info("Vulnerability Scanner Agent starting...")
         
         try:
-            while self._running:
+            while self.running:
                 # Run scan cycle
                 self.run_scan_cycle()
                 
                 # Wait for next scan interval
                 self.logger.info(f"Waiting {self.scan_interval} seconds until next scan cycle")
-                time.sleep(self.scan_interval)
+                self.wait_for_stop(self.scan_interval)
                 
         except KeyboardInterrupt:
             self.logger.info("Received interrupt signal")
@@ -386,7 +386,8 @@ class VulnerabilityScanner(HemoStatAgent):
         Stop the vulnerability scanner agent.
         """
         self.logger.info("Stopping Vulnerability Scanner Agent")
-        self._running = False
+        self.running = False
+        self._stop_event.set()
         
         # Close pub/sub connection
         if hasattr(self, 'pubsub'):
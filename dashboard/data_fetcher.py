@@ -5,13 +5,13 @@ Provides Redis data access layer with efficient caching for dashboard operations
 Uses Streamlit caching decorators to minimize Redis polling and improve performance.
 """
 
-import json
 import os
 from typing import Any
 
 import redis
 import streamlit as st
 
+from agents.agent_base import decode_payload
 from agents.logger import HemoStatLogger
 
 
@@ -21,11 +21,12 @@ def get_redis_client() -> redis.Redis:
     Get or create a cached Redis client for long-lived connections.
 
     Loads Redis configuration from environment variables and establishes
-    a connection with string response decoding enabled. Tests connection
-    on first initialization.
+    a connection that returns raw bytes, matching the agents' clients so
+    compressed agent payloads can be read. Tests connection on first
+    initialization.
 
     Returns:
-        redis.Redis: Connected Redis client instance with decode_responses=True
+        redis.Redis: Connected Redis client instance with decode_responses=False
 
     Raises:
         redis.ConnectionError: If Redis connection cannot be established
@@ -43,7 +44,7 @@ def get_redis_client() -> redis.Redis:
             port=redis_port,
             db=redis_db,
             password=redis_password,
-            decode_responses=True,
+            decode_responses=False,
             socket_connect_timeout=5,
             socket_keepalive=True,
         )
@@ -79,9 +80,9 @@ def get_all_events(limit: int = 1000) -> list[dict]:
         events: list[dict] = []
         for event_str in events_raw:  # type: ignore[union-attr]
             try:
-                event = json.loads(event_str)
+                event = decode_payload(event_str)
                 events.append(event)
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 logger.warning(f"Skipping malformed event JSON: {e}")
                 continue
 
@@ -118,9 +119,9 @@ def get_events_by_type(event_type: str, limit: int = 1000) -> list[dict]:
         events: list[dict] = []
         for event_str in events_raw:  # type: ignore[union-attr]
             try:
-                event = json.loads(event_str)
+                event = decode_payload(event_str)
                 events.append(event)
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 logger.warning(f"Skipping malformed event JSON in {key}: {e}")
                 continue
 
@@ -156,8 +157,8 @@ def get_container_stats(container_id: str) -> dict[str, Any] | None:
             return None
 
         try:
-            return json.loads(stats_str)
-        except json.JSONDecodeError as e:
+            return decode_payload(stats_str)
+        except ValueError as e:
             logger.warning(f"Malformed stats JSON for {container_id}: {e}")
             return None
     except Exception as e:
@@ -188,7 +189,7 @@ def get_active_containers() -> list[str]:
             cursor, keys = client.scan(cursor, match="hemostat:state:container:*", count=100)
             for key in keys:
                 # Extract container ID from key format: hemostat:state:container:{id}
-                container_id = key.replace("hemostat:state:container:", "")
+                container_id = key.decode().replace("hemostat:state:container:", "")
                 container_ids.append(container_id)
 
             if cursor == 0:
@@ -269,13 +270,13 @@ def get_all_container_stats() -> dict[str, dict[str, Any]]:
             for key in keys:
                 try:
                     # Extract container ID from key format: hemostat:stats:{id}
-                    container_id = key.replace("hemostat:stats:", "")
+                    container_id = key.decode().replace("hemostat:stats:", "")
                     stats_str = client.get(key)
 
                     if stats_str:
                         try:
-                            stats_map[container_id] = json.loads(stats_str)
-                        except json.JSONDecodeError as e:
+                            stats_map[container_id] = decode_payload(stats_str)
+                        except ValueError as e:
                             logger.warning(f"Malformed stats JSON for {container_id}: {e}")
                 except Exception as e:
                     logger.warning(f"Error processing stats key {key}: {e}")